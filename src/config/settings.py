@@ -273,6 +273,9 @@ class DashboardConfig:
     # Random seed for reproducible demo data
     demo_random_seed: int = 42
 
+    # How long aggregated dashboard responses are reused (0 disables caching)
+    cache_ttl_seconds: float = 30.0
+
     @classmethod
     def from_environment(cls) -> "DashboardConfig":
         """Create configuration from environment variables."""
@@ -281,6 +284,7 @@ class DashboardConfig:
             host=os.environ.get("DASH_HOST", "0.0.0.0"),
             port=int(os.environ.get("PORT", "8050")),
             title=os.environ.get("DASHBOARD_TITLE", "Platform Health Dashboard"),
+            cache_ttl_seconds=float(os.environ.get("CACHE_TTL_SECONDS", "30")),
         )
 
 
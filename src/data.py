@@ -20,20 +20,41 @@ Usage:
 import logging
 import math
 import random
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
 
 from config import settings
 from models import (
+    Pipeline,
     Platform,
     PlatformId,
     PlatformMetric,
     PlatformMetrics,
     PlatformStatus,
     PlatformTrend,
+    Ticket,
+    TicketColumns,
 )
-from providers import get_data_provider
+from providers import DataProvider, clear_csv_cache, get_data_provider
+from utils import ttl_cache
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +135,25 @@ OUTLIER_THRESHOLDS = {
     },
 }
 
+# Fixed seeds for simulated ticket history, so every worker process draws
+# the same series (str hashes differ between processes)
+_PLATFORM_SEED: Dict[Optional[str], int] = {
+    None: 10_000,
+    "edlap": 10_001,
+    "sapbw": 10_002,
+    "tableau": 10_003,
+    "alteryx": 10_004,
+}
+
+# Shared immutable outlier list for series that never have outliers
+_NO_OUTLIERS: Tuple[Dict[str, Any], ...] = ()
+
+# Label format for chart timestamps
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+
+# Leading "YYYY-MM-DD" or "YYYY-MM-DDTHH:MM" of an ISO 8601 timestamp
+_ISO_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}|$)")
+
 MACHINE_CONFIG = {
     "tableau": {
         "count": settings.machine_configs.tableau.count,
@@ -126,12 +166,142 @@ MACHINE_CONFIG = {
 }
 
 
+# =============================================================================
+# Request Context
+# =============================================================================
+
+
+@dataclass(slots=True)
+class DashboardContext:
+    """
+    Source data shared by all views rendered for a single request.
+
+    Rendering the dashboard touches tickets, pipelines and B/W data from
+    several public functions. Building one context per callback and passing
+    it to each of them loads every source once instead of once per function.
+
+    Attributes:
+        ticket_columns: Column-oriented view of all tickets
+        pipelines: All pipeline records
+        latest_bw: Most recent SAP B/W performance record (None if unavailable)
+        ticket_counts: Active ticket count per platform id
+
+    Example:
+        context = DashboardContext.load()
+        counts = get_summary_counts(context)
+        platforms = get_platforms(context)
+    """
+
+    ticket_columns: TicketColumns
+    pipelines: List[Pipeline]
+    latest_bw: Optional[Dict[str, Any]]
+    ticket_counts: Dict[str, int]
+
+    @classmethod
+    def load(cls, provider: Optional[DataProvider] = None) -> "DashboardContext":
+        """
+        Load all shared source data from the data provider.
+
+        Args:
+            provider: Data provider to load from (defaults to the configured one)
+
+        Returns:
+            A populated DashboardContext
+        """
+        provider = provider or get_data_provider()
+        tickets, pipelines, latest_bw = provider.load_all()
+        ticket_columns = TicketColumns.from_tickets(tickets)
+
+        return cls(
+            ticket_columns=ticket_columns,
+            pipelines=pipelines,
+            latest_bw=latest_bw,
+            ticket_counts=_count_active_tickets_by_platform(ticket_columns),
+        )
+
+
+# =============================================================================
+# Response Caching
+# =============================================================================
+# Aggregated responses are reused for settings.dashboard.cache_ttl_seconds,
+# keyed on the provider's data version so refreshed source files are picked
+# up immediately. Call invalidate_caches() to force a reload.
+
+
+def _data_version() -> Hashable:
+    """Get the current data version of the configured provider."""
+    version: Hashable = get_data_provider().get_data_version()
+    return version
+
+
+_CACHE_TTL = settings.dashboard.cache_ttl_seconds
+
+
+@ttl_cache(_CACHE_TTL, version=_data_version)
+def _shared_context() -> DashboardContext:
+    """Load the context shared by cached responses."""
+    return DashboardContext.load()
+
+
+@ttl_cache(_CACHE_TTL, version=_data_version)
+def _cached_platforms() -> List[Dict[str, Any]]:
+    """Cached get_platforms() response."""
+    return get_platforms(_shared_context())
+
+
+@ttl_cache(_CACHE_TTL, version=_data_version)
+def _cached_summary_counts() -> Dict[str, int]:
+    """Cached get_summary_counts() response."""
+    return get_summary_counts(_shared_context())
+
+
+@ttl_cache(_CACHE_TTL, version=_data_version)
+def _cached_pipeline_summary(platform_id: str) -> Mapping[str, int]:
+    """Cached get_pipeline_summary() response, shared between callers."""
+    return _build_pipeline_summary(platform_id, None)
+
+
+@ttl_cache(_CACHE_TTL, version=_data_version)
+def _cached_bw_memory_stats() -> Mapping[str, float]:
+    """Cached get_bw_memory_stats_30days() response, shared between callers."""
+    stats = get_data_provider().get_bw_memory_stats()
+    return MappingProxyType({"average": stats.average, "peak": stats.peak})
+
+
+@ttl_cache(_CACHE_TTL, version=_data_version)
+def _cached_sapbw_performance_data(hours: int) -> Dict[str, Any]:
+    """Cached get_sapbw_performance_data() response."""
+    return get_sapbw_performance_data(hours, get_data_provider().load_bw_performance())
+
+
+# =============================================================================
+# Performance Data Dispatch
+# =============================================================================
+# Performance data getters register themselves here by platform id, so
+# get_performance_data() is a single table lookup.
+
+PerformanceGetter = Callable[[int], Dict[str, Any]]
+_G = TypeVar("_G", bound=PerformanceGetter)
+
+_PERF_DISPATCH: Dict[str, PerformanceGetter] = {}
+
+
+def _register(platform_id: str) -> Callable[[_G], _G]:
+    """Register a performance data getter for a platform id."""
+
+    def decorator(getter: _G) -> _G:
+        _PERF_DISPATCH[platform_id] = getter
+        return getter
+
+    return decorator
+
+
 # =============================================================================
 # Public API - Main data access functions
 # =============================================================================
 
 
-def get_platforms() -> List[Dict[str, Any]]:
+def get_platforms(context: Optional[DashboardContext] = None) -> List[Dict[str, Any]]:
     """
     Get platform health data for all monitored platforms.
 
@@ -141,16 +311,20 @@ def get_platforms() -> List[Dict[str, Any]]:
     3. Loads real pipeline status data
     4. Determines health status based on configured thresholds
 
+    Args:
+        context: Shared request data. If None, a cached response is returned.
+
     Returns:
         List of platform dictionaries compatible with Dash components
     """
-    provider = get_data_provider()
+    if context is None:
+        cached: List[Dict[str, Any]] = _cached_platforms()
+        return cached
 
-    # Get real ticket counts by platform
-    ticket_counts = _get_ticket_counts_by_platform()
+    ticket_counts = context.ticket_counts
 
     # Get real SAP B/W performance data (latest record)
-    latest_bw = provider.get_latest_bw_performance()
+    latest_bw = context.latest_bw
     if latest_bw:
         bw_memory = latest_bw["memory_usage_tb"]
         bw_storage = latest_bw["storage_usage_tb"]
@@ -162,11 +336,11 @@ def get_platforms() -> List[Dict[str, Any]]:
         bw_memory_capacity = 24.0
 
     # Get real pipeline data
-    edlap_pipeline_summary = get_pipeline_summary("edlap")
+    edlap_pipeline_summary = get_pipeline_summary("edlap", context)
     edlap_failures = edlap_pipeline_summary.get("failed", 2)
     edlap_delays = edlap_pipeline_summary.get("delayed", 8)
 
-    sapbw_pipeline_summary = get_pipeline_summary("sapbw")
+    sapbw_pipeline_summary = get_pipeline_summary("sapbw", context)
     sapbw_failures = sapbw_pipeline_summary.get("failed", 0)
 
     # Build platform objects with determined status
@@ -180,42 +354,53 @@ def get_platforms() -> List[Dict[str, Any]]:
     return [p.to_dict() for p in platforms]
 
 
-def get_tickets() -> List[Dict[str, Any]]:
+def get_tickets(context: Optional[DashboardContext] = None) -> List[Dict[str, Any]]:
     """
     Get ticket data from the data provider.
 
     Loads active tickets from the configured data source, sorted by
     priority (High first) then by age (oldest first).
 
+    Args:
+        context: Shared request data (tickets are loaded from the provider if None)
+
     Returns:
         List of ticket dictionaries compatible with Dash components
     """
-    provider = get_data_provider()
-    active_tickets = provider.get_active_tickets()
+    if context is not None:
+        columns = context.ticket_columns
+    else:
+        columns = get_data_provider().get_ticket_columns()
 
-    # Sort by priority then age
-    priority_order = {"High": 0, "Medium": 1, "Low": 2}
-    active_tickets.sort(key=lambda t: (priority_order.get(t.priority.value, 2), -t.age_days))
+    # Sort active rows by priority then age (lexsort keys are last-key-primary)
+    active = np.flatnonzero(columns.is_active)
+    order = active[np.lexsort((-columns.ages_days[active], columns.priorities[active]))]
 
-    return [t.to_dict() for t in active_tickets]
+    return [columns.tickets[i].to_dict() for i in order.tolist()]
 
 
-def get_summary_counts() -> Dict[str, int]:
+def get_summary_counts(context: Optional[DashboardContext] = None) -> Dict[str, int]:
     """
     Get summary counts for the dashboard header.
 
+    Args:
+        context: Shared request data. If None, a cached response is returned.
+
     Returns:
         Dictionary with counts for healthy, attention, critical platforms
         and total open tickets
     """
-    platforms = get_platforms()
-    tickets = get_tickets()
+    if context is None:
+        cached: Dict[str, int] = _cached_summary_counts()
+        return cached
+
+    platforms = get_platforms(context)
 
     return {
         "healthy": sum(1 for p in platforms if p["status"] == "healthy"),
         "attention": sum(1 for p in platforms if p["status"] == "attention"),
         "critical": sum(1 for p in platforms if p["status"] == "critical"),
-        "total_tickets": len(tickets),
+        "total_tickets": int(context.ticket_columns.is_active.sum()),
     }
 
 
@@ -230,29 +415,34 @@ def get_performance_data(platform_id: str, hours: int = 24) -> Dict[str, Any]:
     Returns:
         Performance data dictionary compatible with Dash graphing components
     """
-    if platform_id == "edlap":
-        return get_edlap_performance_data(hours)
-    elif platform_id == "sapbw":
-        return get_sapbw_performance_data(hours)
-    elif platform_id == "tableau":
-        return get_tableau_performance_data(hours)
-    elif platform_id == "alteryx":
-        return get_alteryx_performance_data(hours)
-    return {}
+    getter = _PERF_DISPATCH.get(platform_id)
+    return getter(hours) if getter is not None else {}
 
 
-def get_pipeline_summary(platform_id: str = "edlap") -> Dict[str, int]:
+def get_pipeline_summary(
+    platform_id: str = "edlap", context: Optional[DashboardContext] = None
+) -> Mapping[str, int]:
     """
     Get current pipeline counts for platform bar chart.
 
     Args:
         platform_id: Platform identifier (edlap or sapbw)
+        context: Shared request data. If None, a cached summary is returned.
 
     Returns:
-        Dictionary with pipeline status counts
+        Read-only mapping with pipeline status counts
     """
-    provider = get_data_provider()
-    summary = provider.get_pipeline_summary(platform_id)
+    if context is None:
+        cached: Mapping[str, int] = _cached_pipeline_summary(platform_id)
+        return cached
+    return _build_pipeline_summary(platform_id, context.pipelines)
+
+
+def _build_pipeline_summary(
+    platform_id: str, pipelines: Optional[List[Pipeline]]
+) -> Mapping[str, int]:
+    """Summarize pipeline statuses, falling back to demo counts if there are none."""
+    summary = get_data_provider().get_pipeline_summary(platform_id, pipelines)
 
     if summary.total == 0:
         # Fallback to generated data for demo
@@ -261,16 +451,17 @@ def get_pipeline_summary(platform_id: str = "edlap") -> Dict[str, int]:
         failed = random.randint(1, 5)
         delayed = random.randint(3, 10)
         successful = total - failed - delayed
-        return {
-            "successful": successful,
-            "delayed": delayed,
-            "failed": failed,
-            "not_applicable": 0,
-            "total": total,
-        }
+        return MappingProxyType(
+            {
+                "successful": successful,
+                "delayed": delayed,
+                "failed": failed,
+                "not_applicable": 0,
+                "total": total,
+            }
+        )
 
-    result: Dict[str, int] = summary.to_dict()
-    return result
+    return MappingProxyType(summary.to_dict())
 
 
 def get_historical_stats(values: List[float], period: str = "month") -> Dict[str, float]:
@@ -294,15 +485,14 @@ def get_historical_stats(values: List[float], period: str = "month") -> Dict[str
     current_avg = sum(values) / len(values)
     current_max = max(values)
 
-    # Simulate historical variation
-    random.seed(100)
+    # Simulate historical variation with a private generator, leaving the
+    # global random state untouched
+    rng = np.random.default_rng(100)
 
     if period == "month":
-        avg_factor = random.uniform(0.92, 1.08)
-        peak_factor = random.uniform(1.1, 1.35)
+        avg_factor, peak_factor = rng.uniform((0.92, 1.1), (1.08, 1.35)).tolist()
     else:  # week
-        avg_factor = random.uniform(0.95, 1.05)
-        peak_factor = random.uniform(1.05, 1.2)
+        avg_factor, peak_factor = rng.uniform((0.95, 1.05), (1.05, 1.2)).tolist()
 
     return {
         "average": round(current_avg * avg_factor, 2),
@@ -310,7 +500,11 @@ def get_historical_stats(values: List[float], period: str = "month") -> Dict[str
     }
 
 
-def get_ticket_history(platform_id: Optional[str] = None, days: int = 30) -> Dict[str, Any]:
+def get_ticket_history(
+    platform_id: Optional[str] = None,
+    days: int = 30,
+    tickets: Optional[List[Ticket]] = None,
+) -> Dict[str, Any]:
     """
     Get ticket history data for line graphs.
 
@@ -321,78 +515,100 @@ def get_ticket_history(platform_id: Optional[str] = None, days: int = 30) -> Dic
     Args:
         platform_id: Filter to specific platform or None for all
         days: Number of days of history to generate
+        tickets: Already loaded tickets (loaded from the provider if None)
 
     Returns:
         Dictionary with timestamps and ticket counts
     """
-    provider = get_data_provider()
-    tickets = provider.load_tickets()
-
-    # Filter to platform if specified
-    if platform_id:
+    if tickets is None:
+        provider = get_data_provider()
+        if platform_id:
+            tickets = provider.load_tickets_by_platform().get(platform_id, [])
+        else:
+            tickets = provider.load_tickets()
+    elif platform_id:
+        # Filter to platform if specified
         tickets = [t for t in tickets if t.platform.value == platform_id]
 
-    # Get current counts
-    active_tickets = [t for t in tickets if t.is_active]
-    current_count = len(active_tickets)
-    breached_count = len([t for t in active_tickets if t.is_breached])
-
-    # Generate simulated history
-    now = datetime.now()
-    timestamps = []
-    open_tickets = []
-    overdue_tickets = []
-
-    random.seed(hash(platform_id or "all") % 2**32)
-
-    for i in range(days, -1, -1):
-        date = now - timedelta(days=i)
-        timestamps.append(date.strftime("%Y-%m-%d"))
-
-        # Simulate ticket count history trending towards current value
-        progress = (days - i) / days
-        base_count = int(current_count * 0.7 + current_count * 0.6 * progress)
-        daily_variation = random.randint(-3, 4)
-        count = max(0, base_count + daily_variation)
+    # Get current counts in a single pass
+    current_count = 0
+    breached_count = 0
+    for ticket in tickets:
+        if ticket.is_active:
+            current_count += 1
+            if ticket.is_breached:
+                breached_count += 1
 
-        # Weekday vs weekend pattern
-        if date.weekday() >= 5:
-            count = int(count * 0.85)
+    # Generate simulated history, one array element per day (oldest first)
+    n = days + 1
+    dates = pd.date_range(end=pd.Timestamp.now().normalize(), periods=n, freq="D")
+    rng = np.random.default_rng(_PLATFORM_SEED.get(platform_id or None, _PLATFORM_SEED[None]))
 
-        open_tickets.append(count)
+    # Simulate ticket count history trending towards current value
+    progress = np.arange(n) / max(days, 1)
+    base_count = (current_count * 0.7 + current_count * 0.6 * progress).astype(np.int32)
+    counts = np.maximum(0, base_count + rng.integers(-3, 5, size=n, dtype=np.int32))
 
-        # Overdue is typically 15-35% of open tickets
-        overdue_base = int(count * (0.15 + 0.2 * random.random()))
-        overdue_variation = random.randint(-1, 1)
-        overdue = max(0, min(count, overdue_base + overdue_variation))
+    # Weekday vs weekend pattern
+    counts = np.where(dates.weekday >= 5, (counts * 0.85).astype(np.int32), counts)
 
-        if i == 0:
-            overdue = breached_count
+    # Overdue is typically 15-35% of open tickets
+    overdue_base = (counts * (0.15 + 0.2 * rng.random(n))).astype(np.int32)
+    overdue = np.clip(overdue_base + rng.integers(-1, 2, size=n, dtype=np.int32), 0, counts)
 
-        overdue_tickets.append(overdue)
+    # Ensure the latest values match the current state
+    counts[-1] = current_count
+    overdue[-1] = breached_count
 
-    # Ensure last value matches current count
-    open_tickets[-1] = current_count
+    timestamps: List[str] = dates.strftime("%Y-%m-%d").tolist()
+    open_tickets: List[int] = counts.tolist()
+    overdue_tickets: List[int] = overdue.tolist()
 
     return {
         "timestamps": timestamps,
-        "open_tickets": {"values": open_tickets, "outliers": []},
-        "overdue_tickets": {"values": overdue_tickets, "outliers": []},
+        "open_tickets": {"values": open_tickets, "outliers": _NO_OUTLIERS},
+        "overdue_tickets": {"values": overdue_tickets, "outliers": _NO_OUTLIERS},
         "current_count": current_count,
         "breached_count": breached_count,
     }
 
 
-def get_bw_memory_stats_30days() -> Dict[str, float]:
+def get_bw_memory_stats_30days(
+    bw_records: Optional[List[Dict[str, Any]]] = None,
+) -> Mapping[str, float]:
     """
     Get average and peak memory usage from the last 30 days of B/W data.
 
+    Args:
+        bw_records: Already loaded B/W performance records. If None, cached
+            stats for the provider's records are returned.
+
     Returns:
-        Dictionary with 'average' and 'peak' values in TB
+        Read-only mapping with 'average' and 'peak' values in TB
     """
-    provider = get_data_provider()
-    stats = provider.get_bw_memory_stats()
-    return {"average": stats.average, "peak": stats.peak}
+    if bw_records is None:
+        cached: Mapping[str, float] = _cached_bw_memory_stats()
+        return cached
+
+    stats = get_data_provider().get_bw_memory_stats(bw_records)
+    return MappingProxyType({"average": stats.average, "peak": stats.peak})
+
+
+def invalidate_caches() -> None:
+    """Discard all cached dashboard responses and parsed CSV data."""
+    for cached in (
+        _shared_context,
+        _cached_platforms,
+        _cached_summary_counts,
+        _cached_pipeline_summary,
+        _cached_bw_memory_stats,
+        _cached_sapbw_performance_data,
+        get_edlap_performance_data,
+        get_tableau_performance_data,
+        get_alteryx_performance_data,
+    ):
+        cached.invalidate()
+    clear_csv_cache()
 
 
 # Backward compatibility alias
@@ -409,14 +625,13 @@ def get_ticket_counts_by_platform() -> Dict[str, int]:
 def _get_ticket_counts_by_platform() -> Dict[str, int]:
     """Get count of active tickets per platform."""
     provider = get_data_provider()
-    tickets = provider.load_tickets()
-    counts: Dict[str, int] = defaultdict(int)
+    return _count_active_tickets_by_platform(provider.get_ticket_columns())
 
-    for ticket in tickets:
-        if ticket.is_active:
-            counts[ticket.platform.value] += 1
 
-    return dict(counts)
+def _count_active_tickets_by_platform(columns: TicketColumns) -> Dict[str, int]:
+    """Count active tickets per platform from a column view."""
+    platforms, counts = np.unique(columns.platforms[columns.is_active], return_counts=True)
+    return dict(zip(platforms.tolist(), counts.tolist()))
 
 
 def _build_edlap_platform(ticket_counts: Dict[str, int], failures: int, delays: int) -> Platform:
@@ -529,20 +744,43 @@ def _build_alteryx_platform(ticket_counts: Dict[str, int]) -> Platform:
 # =============================================================================
 
 
+def _parse_iso_timestamp(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp, returning None for empty or malformed values.
+
+    Values are screened with a cheap shape check first so malformed rows
+    are rejected without raising and unwinding an exception.
+    """
+    if not _ISO_TIMESTAMP_RE.match(value):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Right shape but invalid date/time (e.g. month 13)
+        return None
+
+
 def _generate_base_pattern(hours: int = 24, interval_minutes: int = 5) -> List[datetime]:
     """Generate timestamps for the specified duration with given interval."""
     now = datetime.now()
     minutes = (now.minute // interval_minutes) * interval_minutes
     current = now.replace(minute=minutes, second=0, microsecond=0)
 
-    points = []
     total_points = (hours * 60) // interval_minutes
-    for i in range(total_points, 0, -1):
-        points.append(current - timedelta(minutes=i * interval_minutes))
-    points.append(current)
+    points: List[datetime] = (
+        pd.date_range(end=current, periods=total_points + 1, freq=f"{interval_minutes}min")
+        .to_pydatetime()
+        .tolist()
+    )
     return points
 
 
+def _format_timestamps(timestamps: Sequence[datetime]) -> List[str]:
+    """Format timestamps as chart labels in a single vectorized call."""
+    labels: List[str] = pd.DatetimeIndex(timestamps).strftime(_TIMESTAMP_FORMAT).tolist()
+    return labels
+
+
 def _add_daily_pattern(base_value: float, hour: int, amplitude: float = 0.3) -> float:
     """Add daily usage pattern (higher during business hours)."""
     morning_factor = math.exp(-((hour - 10.5) ** 2) / 8)
@@ -557,34 +795,69 @@ def _add_noise(value: float, noise_percent: float = 0.1) -> float:
     return max(0, value + noise)
 
 
+def _round_percent(values: Sequence[float]) -> List[float]:
+    """Round percentages to one decimal place and cap them at 100."""
+    result: List[float] = np.minimum(np.round(values, 1), 100).tolist()
+    return result
+
+
 def _inject_outliers(
     values: Sequence[Union[int, float]],
     outlier_chance: float = 0.02,
     outlier_magnitude: float = 1.5,
 ) -> Tuple[List[float], List[int]]:
-    """Inject outliers into a time series and return indices of outliers."""
-    outlier_indices: List[int] = []
-    result: List[float] = [float(v) for v in values]
-    for i in range(len(result)):
-        if random.random() < outlier_chance:
-            result[i] = result[i] * outlier_magnitude
-            outlier_indices.append(i)
-    return result, outlier_indices
+    """
+    Inject outliers into a time series and return indices of outliers.
+
+    Outlier positions are drawn as one Bernoulli mask. The NumPy generator
+    is seeded from ``random`` so the series stays reproducible under the
+    callers' ``random.seed`` calls.
+    """
+    rng = np.random.default_rng(random.getrandbits(32))
+    result = np.array(values, dtype=float)
+    mask = rng.random(result.size) < outlier_chance
+    result[mask] *= outlier_magnitude
+    return result.tolist(), np.flatnonzero(mask).tolist()
+
+
+def _outlier_kernel(
+    arr: np.ndarray, threshold: Mapping[str, Union[int, float]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Locate threshold outliers in a numeric array.
+
+    The full series is compared once, against the lower of the two levels;
+    the critical level is then only checked for the flagged points.
+
+    Returns:
+        Tuple of (indices of outliers, boolean array marking critical ones)
+    """
+    critical = threshold.get("critical", np.inf)
+    lower = min(threshold.get("warning", np.inf), critical)
+    indices = np.flatnonzero(arr >= lower)
+    return indices, arr[indices] >= critical
 
 
 def detect_outliers(
     values: Sequence[Union[int, float]], threshold: Mapping[str, Union[int, float]]
 ) -> List[Dict[str, Any]]:
-    """Detect outliers based on threshold configuration."""
-    outliers = []
-    for i, val in enumerate(values):
-        if val >= threshold.get("critical", float("inf")):
-            outliers.append({"index": i, "value": val, "severity": "critical"})
-        elif val >= threshold.get("warning", float("inf")):
-            outliers.append({"index": i, "value": val, "severity": "warning"})
-    return outliers
+    """
+    Detect outliers based on threshold configuration.
 
+    Thresholds are evaluated as array comparisons, so only the (typically
+    few) flagged points are visited in Python. Outliers are returned in
+    index order.
+    """
+    arr = np.asarray(values)
+    indices, critical = _outlier_kernel(arr, threshold)
+    return [
+        {"index": i, "value": v, "severity": "critical" if c else "warning"}
+        for i, v, c in zip(indices.tolist(), arr[indices].tolist(), critical.tolist())
+    ]
 
+
+@_register("edlap")
+@ttl_cache(_CACHE_TTL, version=_data_version)
 def get_edlap_performance_data(hours: int = 24) -> Dict[str, Any]:
     """
     Generate EDLAP performance data.
@@ -592,62 +865,58 @@ def get_edlap_performance_data(hours: int = 24) -> Dict[str, Any]:
     Metrics: users, pipelines (total/delayed/failed), tickets (open/overdue)
     """
     timestamps = _generate_base_pattern(hours)
+    n = len(timestamps)
     random.seed(settings.dashboard.demo_random_seed)
 
     # Users - typical 50-150 range with daily pattern
-    users: List[float] = []
-    for ts in timestamps:
+    users: List[float] = [0.0] * n
+    for i, ts in enumerate(timestamps):
         base = 80.0
         val = _add_daily_pattern(base, ts.hour, amplitude=0.6)
         val = _add_noise(val, 0.15)
-        users.append(max(5, round(val)))
+        users[i] = max(5, round(val))
     users, _ = _inject_outliers(users, 0.01, 2.0)
 
     # Total pipelines - relatively stable
-    total_pipelines = []
-    for ts in timestamps:
-        base = 245
-        val = base + random.randint(-5, 5)
-        total_pipelines.append(val)
+    total_pipelines = [0] * n
+    for i in range(n):
+        total_pipelines[i] = 245 + random.randint(-5, 5)
 
     # Failed pipelines - occasional spikes
-    failed_pipelines: List[float] = []
-    for ts in timestamps:
-        base = 2.0
-        val = base + random.randint(0, 3)
-        failed_pipelines.append(val)
+    failed_pipelines: List[float] = [0.0] * n
+    for i in range(n):
+        failed_pipelines[i] = 2.0 + random.randint(0, 3)
     failed_pipelines, _ = _inject_outliers(failed_pipelines, 0.03, 3.0)
 
     # Delayed pipelines - more during business hours
-    delayed_pipelines: List[float] = []
-    for ts in timestamps:
+    delayed_pipelines: List[float] = [0.0] * n
+    for i, ts in enumerate(timestamps):
         base = 5.0
         val = _add_daily_pattern(base, ts.hour, amplitude=0.4)
         val = _add_noise(val, 0.2)
-        delayed_pipelines.append(max(0, round(val)))
+        delayed_pipelines[i] = max(0, round(val))
     delayed_pipelines, _ = _inject_outliers(delayed_pipelines, 0.02, 2.5)
 
     # Open tickets - gradual changes
-    open_tickets = []
+    open_tickets = [0] * n
     base_tickets = 12
-    for i, ts in enumerate(timestamps):
+    for i in range(n):
         base_tickets += random.choice([-1, 0, 0, 0, 1])
         base_tickets = max(5, min(25, base_tickets))
-        open_tickets.append(base_tickets)
+        open_tickets[i] = base_tickets
 
     # Overdue tickets - subset of open
-    overdue_tickets = []
+    overdue_tickets = [0] * n
     for i, ot in enumerate(open_tickets):
-        overdue = max(0, min(ot - 5, round(ot * 0.2 + random.randint(-1, 2))))
-        overdue_tickets.append(overdue)
+        overdue_tickets[i] = max(0, min(ot - 5, round(ot * 0.2 + random.randint(-1, 2))))
 
     # Detect outliers
     thresholds = OUTLIER_THRESHOLDS["edlap"]
 
     return {
-        "timestamps": [ts.strftime("%Y-%m-%d %H:%M") for ts in timestamps],
+        "timestamps": _format_timestamps(timestamps),
         "users": {"values": users, "outliers": detect_outliers(users, thresholds["users"])},
-        "total_pipelines": {"values": total_pipelines, "outliers": []},
+        "total_pipelines": {"values": total_pipelines, "outliers": _NO_OUTLIERS},
         "failed_pipelines": {
             "values": [int(v) for v in failed_pipelines],
             "outliers": detect_outliers(failed_pipelines, thresholds["pipelines_failed"]),
@@ -656,7 +925,7 @@ def get_edlap_performance_data(hours: int = 24) -> Dict[str, Any]:
             "values": [int(v) for v in delayed_pipelines],
             "outliers": detect_outliers(delayed_pipelines, thresholds["pipelines_delayed"]),
         },
-        "open_tickets": {"values": open_tickets, "outliers": []},
+        "open_tickets": {"values": open_tickets, "outliers": _NO_OUTLIERS},
         "overdue_tickets": {
             "values": overdue_tickets,
             "outliers": detect_outliers(overdue_tickets, thresholds["tickets_overdue"]),
@@ -664,106 +933,117 @@ def get_edlap_performance_data(hours: int = 24) -> Dict[str, Any]:
     }
 
 
-def get_sapbw_performance_data(hours: int = 24) -> Dict[str, Any]:
+@_register("sapbw")
+def get_sapbw_performance_data(
+    hours: int = 24, bw_records: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
     """
     Get SAP B/W performance data.
 
     Uses real memory data from bw_system_performance.csv where available.
     Metrics: users, memory (TB), avg dashboard load time, CPU
+
+    Args:
+        hours: Number of hours of data to return
+        bw_records: Already loaded B/W performance records. If None, a cached
+            response built from the provider's records is returned.
     """
-    provider = get_data_provider()
-    bw_records = provider.load_bw_performance()
+    if bw_records is None:
+        cached: Dict[str, Any] = _cached_sapbw_performance_data(hours)
+        return cached
 
     if bw_records:
         # Use real data - take the most recent records
         recent_records = bw_records[-min(len(bw_records), 289) :]
 
         timestamps = []
+        record_hours = []
         memory_tb = []
 
         for record in recent_records:
-            ts_str = record.get("snapshot_ts", "")
-            if ts_str:
-                try:
-                    ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                    timestamps.append(ts.strftime("%Y-%m-%d %H:%M"))
-                except (ValueError, TypeError):
-                    continue
-                memory_tb.append(record["memory_usage_tb"])
+            ts = _parse_iso_timestamp(record.get("snapshot_ts", ""))
+            if ts is None:
+                continue
+            timestamps.append(ts.strftime(_TIMESTAMP_FORMAT))
+            record_hours.append(ts.hour)
+            memory_tb.append(record["memory_usage_tb"])
 
         memory_capacity = recent_records[-1]["memory_capacity_tb"] if recent_records else 23.25
+        n = len(timestamps)
 
         # Generate simulated users and other metrics
         random.seed(43)
-        users = []
-        for i, ts_str in enumerate(timestamps):
-            try:
-                hour = int(ts_str.split(" ")[1].split(":")[0])
-            except (IndexError, ValueError):
-                hour = 12
+        users = [0] * n
+        for i, hour in enumerate(record_hours):
             base = 45.0
             val = _add_daily_pattern(base, hour, amplitude=0.8)
             val = _add_noise(val, 0.12)
-            users.append(max(3, round(val)))
+            users[i] = max(3, round(val))
 
         # Dashboard load time - correlate with memory usage
-        load_times = []
-        for i in range(len(timestamps)):
+        load_times = [0.0] * n
+        for i in range(n):
             base = 4.5
-            memory_factor = memory_tb[i] / 19 if i < len(memory_tb) else 1.0
+            memory_factor = memory_tb[i] / 19
             val = base * (0.8 + 0.4 * memory_factor)
             val = _add_noise(val, 0.2)
-            load_times.append(round(val, 2))
+            load_times[i] = round(val, 2)
 
         # CPU percent - correlate with memory
-        cpu_percent = []
-        for i in range(len(timestamps)):
+        cpu_percent = [0.0] * n
+        for i in range(n):
             base = 35.0
-            memory_factor = memory_tb[i] / 19 if i < len(memory_tb) else 1.0
+            memory_factor = memory_tb[i] / 19
             val = base * (0.7 + 0.5 * memory_factor)
             val = _add_noise(val, 0.15)
-            cpu_percent.append(min(100, round(val, 1)))
+            cpu_percent[i] = val
+        cpu_percent = _round_percent(cpu_percent)
 
     else:
         # Fallback to generated data
         generated_timestamps = _generate_base_pattern(hours)
-        timestamps = [ts.strftime("%Y-%m-%d %H:%M") for ts in generated_timestamps]
+        n = len(generated_timestamps)
+        timestamps = _format_timestamps(generated_timestamps)
         random.seed(43)
         memory_capacity = 24.0
 
-        users = []
-        for ts in generated_timestamps:
+        users = [0] * n
+        for i, ts in enumerate(generated_timestamps):
             base = 45.0
             val = _add_daily_pattern(base, ts.hour, amplitude=0.8)
             val = _add_noise(val, 0.12)
-            users.append(max(3, round(val)))
+            users[i] = max(3, round(val))
 
-        memory_tb = []
-        for ts in generated_timestamps:
+        memory_tb = [0.0] * n
+        for i, ts in enumerate(generated_timestamps):
             base = 18.2
             val = _add_daily_pattern(base, ts.hour, amplitude=0.15)
             val = _add_noise(val, 0.03)
-            memory_tb.append(round(val, 2))
+            memory_tb[i] = round(val, 2)
         memory_tb, _ = _inject_outliers(memory_tb, 0.02, 1.15)
 
-        load_times = []
-        for i, ts in enumerate(generated_timestamps):
+        load_times = [0.0] * n
+        for i in range(n):
             base = 4.5
             user_factor = users[i] / 50
             val = base * (1 + 0.3 * user_factor)
             val = _add_noise(val, 0.2)
-            load_times.append(round(val, 2))
+            load_times[i] = round(val, 2)
         load_times, _ = _inject_outliers(load_times, 0.03, 2.0)
 
-        cpu_percent = []
-        for i, ts in enumerate(generated_timestamps):
+        cpu_percent = [0.0] * n
+        for i in range(n):
             base = 35
             user_factor = users[i] / 50
             memory_factor = memory_tb[i] / 18
             val = base * (1 + 0.4 * user_factor + 0.3 * memory_factor)
             val = _add_noise(val, 0.15)
-            cpu_percent.append(min(100, round(val, 1)))
-        cpu_percent, _ = _inject_outliers(cpu_percent, 0.02, 1.4)
+            cpu_percent[i] = val
+        cpu_percent, _ = _inject_outliers(_round_percent(cpu_percent), 0.02, 1.4)
+
+    # Cap at physical limits (injected outliers may overshoot)
+    capped_memory = np.minimum(memory_tb, memory_capacity).tolist()
+    capped_cpu = np.minimum(cpu_percent, 100).tolist()
 
     # Detect outliers
     thresholds = OUTLIER_THRESHOLDS["sapbw"]
@@ -772,7 +1052,7 @@ def get_sapbw_performance_data(hours: int = 24) -> Dict[str, Any]:
         "timestamps": timestamps,
         "users": {"values": users, "outliers": detect_outliers(users, thresholds["users"])},
         "memory_tb": {
-            "values": [min(memory_capacity, v) for v in memory_tb],
+            "values": capped_memory,
             "outliers": detect_outliers(memory_tb, thresholds["memory_tb"]),
         },
         "memory_capacity": memory_capacity,
@@ -781,10 +1061,8 @@ def get_sapbw_performance_data(hours: int = 24) -> Dict[str, Any]:
             "outliers": detect_outliers(load_times, thresholds["load_time_sec"]),
         },
         "cpu_percent": {
-            "values": [min(100, v) for v in cpu_percent],
-            "outliers": detect_outliers(
-                [min(100, v) for v in cpu_percent], thresholds["cpu_percent"]
-            ),
+            "values": capped_cpu,
+            "outliers": detect_outliers(capped_cpu, thresholds["cpu_percent"]),
         },
     }
 
@@ -800,6 +1078,7 @@ def _generate_multi_machine_data(
 ) -> Tuple[List[datetime], Dict[str, Dict[str, List[float]]]]:
     """Generate performance data for multi-machine platforms."""
     timestamps = _generate_base_pattern(hours)
+    n = len(timestamps)
 
     machines = {}
     for m in range(machine_count):
@@ -807,44 +1086,69 @@ def _generate_multi_machine_data(
         random.seed(44 + m)
 
         # Users per machine
-        users: List[float] = []
-        for ts in timestamps:
+        users: List[float] = [0.0] * n
+        for i, ts in enumerate(timestamps):
             base = base_users / machine_count
             val = _add_daily_pattern(base, ts.hour, amplitude=0.7)
             val = _add_noise(val, 0.2)
             if m < 2:
                 val *= 1.3
-            users.append(float(max(0, round(val))))
+            users[i] = float(max(0, round(val)))
 
         # Memory percent
-        memory_pct: List[float] = []
-        for i, ts in enumerate(timestamps):
+        memory_pct: List[float] = [0.0] * n
+        for i in range(n):
             base = base_memory
             user_factor = users[i] / (base_users / machine_count)
             val = base * (0.7 + 0.3 * user_factor)
             val = _add_noise(val, 0.1)
-            memory_pct.append(float(min(100, round(val, 1))))
-        memory_pct, _ = _inject_outliers(memory_pct, 0.02, 1.2)
+            memory_pct[i] = val
+        memory_pct, _ = _inject_outliers(_round_percent(memory_pct), 0.02, 1.2)
 
         # CPU percent
-        cpu_pct: List[float] = []
-        for i, ts in enumerate(timestamps):
+        cpu_pct: List[float] = [0.0] * n
+        for i in range(n):
             base = base_cpu
             user_factor = users[i] / (base_users / machine_count)
             val = base * (0.6 + 0.4 * user_factor)
             val = _add_noise(val, 0.15)
-            cpu_pct.append(float(min(100, round(val, 1))))
-        cpu_pct, _ = _inject_outliers(cpu_pct, 0.025, 1.3)
+            cpu_pct[i] = val
+        cpu_pct, _ = _inject_outliers(_round_percent(cpu_pct), 0.025, 1.3)
 
         machines[machine_name] = {
             "users": users,
-            "memory_percent": [min(100, v) for v in memory_pct],
-            "cpu_percent": [min(100, v) for v in cpu_pct],
+            "memory_percent": np.minimum(memory_pct, 100.0).tolist(),
+            "cpu_percent": np.minimum(cpu_pct, 100.0).tolist(),
         }
 
     return timestamps, machines
 
 
+def _aggregate_machines(
+    machines: Dict[str, Dict[str, List[float]]]
+) -> Tuple[List[float], List[float], List[float]]:
+    """
+    Aggregate per-machine series across machines.
+
+    Each metric is stacked into a (machines x timestamps) matrix and reduced
+    along the machine axis in a single NumPy operation.
+
+    Returns:
+        Tuple of (total users, average memory %, average CPU %) per timestamp
+    """
+    users = np.array([m["users"] for m in machines.values()], dtype=float)
+    memory = np.array([m["memory_percent"] for m in machines.values()], dtype=float)
+    cpu = np.array([m["cpu_percent"] for m in machines.values()], dtype=float)
+
+    return (
+        users.sum(axis=0).tolist(),
+        np.round(memory.mean(axis=0), 1).tolist(),
+        np.round(cpu.mean(axis=0), 1).tolist(),
+    )
+
+
+@_register("tableau")
+@ttl_cache(_CACHE_TTL, version=_data_version)
 def get_tableau_performance_data(hours: int = 24) -> Dict[str, Any]:
     """
     Generate Tableau performance data (8 machines).
@@ -865,27 +1169,17 @@ def get_tableau_performance_data(hours: int = 24) -> Dict[str, Any]:
     random.seed(48)
 
     # Aggregate metrics
-    total_users = []
-    avg_memory = []
-    avg_cpu = []
-
-    for i in range(len(timestamps)):
-        users_sum = sum(m["users"][i] for m in machines.values())
-        mem_avg = sum(m["memory_percent"][i] for m in machines.values()) / len(machines)
-        cpu_avg = sum(m["cpu_percent"][i] for m in machines.values()) / len(machines)
-        total_users.append(users_sum)
-        avg_memory.append(round(mem_avg, 1))
-        avg_cpu.append(round(cpu_avg, 1))
+    total_users, avg_memory, avg_cpu = _aggregate_machines(machines)
 
     # Dashboard load time
-    load_times = []
-    for i, ts in enumerate(timestamps):
+    load_times = [0.0] * len(timestamps)
+    for i in range(len(timestamps)):
         base = 3.8
         user_factor = total_users[i] / 180
         cpu_factor = avg_cpu[i] / 50
         val = base * (0.7 + 0.2 * user_factor + 0.1 * cpu_factor)
         val = _add_noise(val, 0.15)
-        load_times.append(round(val, 2))
+        load_times[i] = round(val, 2)
     load_times, _ = _inject_outliers(load_times, 0.04, 2.5)
 
     thresholds = OUTLIER_THRESHOLDS["tableau"]
@@ -899,7 +1193,7 @@ def get_tableau_performance_data(hours: int = 24) -> Dict[str, Any]:
         }
 
     return {
-        "timestamps": [ts.strftime("%Y-%m-%d %H:%M") for ts in timestamps],
+        "timestamps": _format_timestamps(timestamps),
         "machines": machines,
         "machine_outliers": machine_outliers,
         "aggregated": {
@@ -923,6 +1217,8 @@ def get_tableau_performance_data(hours: int = 24) -> Dict[str, Any]:
     }
 
 
+@_register("alteryx")
+@ttl_cache(_CACHE_TTL, version=_data_version)
 def get_alteryx_performance_data(hours: int = 24) -> Dict[str, Any]:
     """
     Generate Alteryx performance data (8 worker machines).
@@ -943,27 +1239,17 @@ def get_alteryx_performance_data(hours: int = 24) -> Dict[str, Any]:
     random.seed(52)
 
     # Aggregate metrics
-    total_users = []
-    avg_memory = []
-    avg_cpu = []
-
-    for i in range(len(timestamps)):
-        users_sum = sum(m["users"][i] for m in machines.values())
-        mem_avg = sum(m["memory_percent"][i] for m in machines.values()) / len(machines)
-        cpu_avg = sum(m["cpu_percent"][i] for m in machines.values()) / len(machines)
-        total_users.append(users_sum)
-        avg_memory.append(round(mem_avg, 1))
-        avg_cpu.append(round(cpu_avg, 1))
+    total_users, avg_memory, avg_cpu = _aggregate_machines(machines)
 
     # Average workflow execution time
-    load_times = []
-    for i, ts in enumerate(timestamps):
+    load_times = [0.0] * len(timestamps)
+    for i in range(len(timestamps)):
         base = 85
         user_factor = total_users[i] / 40
         cpu_factor = avg_cpu[i] / 45
         val = base * (0.8 + 0.15 * user_factor + 0.05 * cpu_factor)
         val = _add_noise(val, 0.2)
-        load_times.append(round(val, 1))
+        load_times[i] = round(val, 1)
     load_times, _ = _inject_outliers(load_times, 0.02, 1.8)
 
     thresholds = OUTLIER_THRESHOLDS["alteryx"]
@@ -977,7 +1263,7 @@ def get_alteryx_performance_data(hours: int = 24) -> Dict[str, Any]:
         }
 
     return {
-        "timestamps": [ts.strftime("%Y-%m-%d %H:%M") for ts in timestamps],
+        "timestamps": _format_timestamps(timestamps),
         "machines": machines,
         "machine_outliers": machine_outliers,
         "aggregated": {
@@ -13,7 +13,7 @@ from .platform import (
     PlatformMetrics,
     PlatformTrend,
 )
-from .ticket import Ticket, TicketPriority, TicketStatus
+from .ticket import Ticket, TicketColumns, TicketPriority, TicketStatus
 from .performance import (
     PerformanceData,
     MetricWithOutliers,
@@ -38,6 +38,7 @@ __all__ = [
     "PlatformTrend",
     # Ticket models
     "Ticket",
+    "TicketColumns",
     "TicketPriority",
     "TicketStatus",
     # Performance models
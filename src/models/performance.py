@@ -2,11 +2,16 @@
 Performance data models.
 
 Defines models for time-series performance data, metrics, and statistics.
+
+Models can be passed straight to utils.serialize(), which encodes each of
+them as its to_dict().
 """
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+import numpy as np
 
 
 class OutlierSeverity(str, Enum):
@@ -16,7 +21,7 @@ class OutlierSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class Outlier:
     """
     Represents a detected outlier in a time series.
@@ -40,28 +45,99 @@ class Outlier:
         }
 
 
-@dataclass
+# Outlier severities by their code in MetricWithOutliers.outlier_severities
+_SEVERITY_CODES = (OutlierSeverity.WARNING, OutlierSeverity.CRITICAL)
+
+
+def _float32_to_list(values: np.ndarray) -> List[float]:
+    """
+    Convert a float32 array to Python floats without widening artifacts.
+
+    All metrics are generated at one decimal place, so rounding the widened
+    values back to one decimal yields 45.3 rather than 45.29999923706055.
+    """
+    result: List[float] = np.round(values.astype(np.float64), 1).tolist()
+    return result
+
+
+@dataclass(slots=True)
 class MetricWithOutliers:
     """
     A metric time series with detected outliers.
 
+    Outliers are stored as parallel arrays instead of one Outlier object
+    each; Outlier objects are only built on demand by the outliers property.
+
+    Values are stored as float32 (percentages, TB and seconds need far
+    fewer than float64's digits); sequences passed in are converted.
+
     Attributes:
-        values: List of metric values
-        outliers: List of detected outliers
+        values: Metric values
+        outlier_indices: Position of each outlier in values
+        outlier_values: Value of each outlier
+        outlier_severities: Severity code of each outlier (0 warning, 1 critical)
     """
 
-    values: List[float] = field(default_factory=list)
-    outliers: List[Outlier] = field(default_factory=list)
+    values: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    outlier_indices: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    outlier_values: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    outlier_severities: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+
+    def __post_init__(self) -> None:
+        """Store values as a float32 array."""
+        self.values = np.asarray(self.values, dtype=np.float32)
+
+    @classmethod
+    def from_outliers(
+        cls, values: Sequence[float], outliers: Sequence[Outlier]
+    ) -> "MetricWithOutliers":
+        """
+        Build a metric from its values and a list of Outlier objects.
+
+        Args:
+            values: Metric values
+            outliers: Detected outliers
+
+        Returns:
+            MetricWithOutliers with the outliers stored as parallel arrays
+        """
+        return cls(
+            values=np.asarray(values, dtype=np.float32),
+            outlier_indices=np.array([o.index for o in outliers], dtype=np.int32),
+            outlier_values=np.array([o.value for o in outliers], dtype=np.float64),
+            outlier_severities=np.array(
+                [_SEVERITY_CODES.index(o.severity) for o in outliers], dtype=np.uint8
+            ),
+        )
+
+    @property
+    def outliers(self) -> List[Outlier]:
+        """Detected outliers as Outlier objects."""
+        return [
+            Outlier(index=i, value=v, severity=_SEVERITY_CODES[s])
+            for i, v, s in zip(
+                self.outlier_indices.tolist(),
+                self.outlier_values.tolist(),
+                self.outlier_severities.tolist(),
+            )
+        ]
 
     def to_dict(self) -> dict:
         """Convert to dictionary for Dash components."""
         return {
-            "values": self.values,
-            "outliers": [o.to_dict() for o in self.outliers],
+            "values": _float32_to_list(self.values),
+            "outliers": [
+                {"index": i, "value": v, "severity": _SEVERITY_CODES[s].value}
+                for i, v, s in zip(
+                    self.outlier_indices.tolist(),
+                    self.outlier_values.tolist(),
+                    self.outlier_severities.tolist(),
+                )
+            ],
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoricalStats:
     """
     Historical statistics for a metric.
@@ -82,7 +158,7 @@ class HistoricalStats:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineSummary:
     """
     Summary of pipeline statuses for a platform.
@@ -116,7 +192,7 @@ class PipelineSummary:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketHistory:
     """
     Historical ticket data for line graphs.
@@ -146,7 +222,7 @@ class TicketHistory:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceData:
     """
     Base class for platform performance data.
@@ -165,7 +241,7 @@ class PerformanceData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EdlapPerformanceData(PerformanceData):
     """
     EDLAP-specific performance data.
@@ -186,7 +262,8 @@ class EdlapPerformanceData(PerformanceData):
 
     def to_dict(self) -> dict:
         """Convert to dictionary for Dash components."""
-        base = super().to_dict()
+        # Zero-argument super() does not work in slotted dataclasses
+        base = PerformanceData.to_dict(self)
         base.update(
             {
                 "total_pipelines": self.total_pipelines.to_dict(),
@@ -199,7 +276,7 @@ class EdlapPerformanceData(PerformanceData):
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class SapbwPerformanceData(PerformanceData):
     """
     SAP B/W-specific performance data.
@@ -218,7 +295,8 @@ class SapbwPerformanceData(PerformanceData):
 
     def to_dict(self) -> dict:
         """Convert to dictionary for Dash components."""
-        base = super().to_dict()
+        # Zero-argument super() does not work in slotted dataclasses
+        base = PerformanceData.to_dict(self)
         base.update(
             {
                 "memory_tb": self.memory_tb.to_dict(),
@@ -230,7 +308,7 @@ class SapbwPerformanceData(PerformanceData):
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class MachineData:
     """
     Performance data for a single machine.
@@ -251,7 +329,7 @@ class MachineData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MachineOutliers:
     """Outliers detected for a single machine."""
 
@@ -266,7 +344,7 @@ class MachineOutliers:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedMetrics:
     """
     Aggregated metrics across all machines.
@@ -289,7 +367,7 @@ class AggregatedMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiMachinePerformanceData:
     """
     Performance data for multi-machine platforms (Tableau, Alteryx).
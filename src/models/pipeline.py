@@ -4,9 +4,10 @@ Pipeline data models.
 Defines the Pipeline entity for tracking data pipeline status.
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
 
 from .platform import PlatformId
 
@@ -33,31 +34,52 @@ class PipelineStatus(str, Enum):
         Returns:
             Parsed PipelineStatus
         """
-        status_lower = status.lower()
-        original_lower = original_status.lower()
-
-        if "failed" in status_lower or original_lower == "r" or "failed" in original_lower:
-            return cls.FAILED
-        elif "delayed" in status_lower:
-            return cls.DELAYED
-        elif "not applicable" in status_lower:
-            return cls.NOT_APPLICABLE
-        elif "running" in status_lower:
-            return cls.RUNNING
-        elif "pending" in status_lower or "scheduled" in status_lower:
-            return cls.PENDING
-        elif (
-            "within expected" in status_lower
-            or original_lower == "g"
-            or "succeeded" in original_lower
-        ):
-            return cls.SUCCESSFUL
-        else:
-            # Default to successful if status is unclear
-            return cls.SUCCESSFUL
+        return _classify_status(status, original_status)
+
+
+# Status rules in priority order, matched against "<status>\0<original>"
+# (both lowercased). Each alternative is a lookahead at position 0, so the
+# first rule that applies anywhere in the string wins, and the group name
+# is the PipelineStatus value. "failed" may appear in either part; the
+# other keywords only count in the transformed status. Anything else,
+# including "within expected" / "g" / "succeeded", is successful. \Z is
+# used rather than $, which would also match before a trailing newline.
+_STATUS_RULES = re.compile(
+    r"(?P<failed>(?=.*failed)|(?=.*\x00r\Z))"
+    r"|(?P<delayed>(?=[^\x00]*delayed))"
+    r"|(?P<not_applicable>(?=[^\x00]*not applicable))"
+    r"|(?P<running>(?=[^\x00]*running))"
+    r"|(?P<pending>(?=[^\x00]*(?:pending|scheduled)))",
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=256)
+def _classify_status(status: str, original_status: str) -> PipelineStatus:
+    """
+    Classify a raw status pair, memoized per distinct pair.
+
+    Exports repeat a handful of status strings across thousands of rows, so
+    the compiled rules run once per distinct pair and every other row is a
+    dictionary hit. The rules are order-dependent (a failed original status
+    wins over any transformed status), which is why the cache is keyed on
+    the exact pair rather than on either string alone.
+    """
+    match = _STATUS_RULES.match(f"{status.lower()}\x00{original_status.lower()}")
+    if match is None or match.lastgroup is None:
+        # Default to successful if status is unclear
+        return PipelineStatus.SUCCESSFUL
+    return PipelineStatus(match.lastgroup)
 
 
-@dataclass
+# Internal platform ids by pipelines CSV platform_id value
+_PLATFORM_MAP = {
+    "EDLAP": PlatformId.EDLAP,
+    "SAP_BW": PlatformId.SAPBW,
+}
+
+
+@dataclass(slots=True)
 class Pipeline:
     """
     Represents a data pipeline execution record.
@@ -74,6 +96,7 @@ class Pipeline:
         end_ts: Actual end timestamp
         expected_end_ts: Expected end timestamp
         delay_seconds: Delay in seconds (0 if on time or early)
+        shown_status: Display status for the bar chart, e.g. "Delayed" (derived)
     """
 
     platform: PlatformId
@@ -84,6 +107,11 @@ class Pipeline:
     end_ts: str = ""
     expected_end_ts: str = ""
     delay_seconds: float = 0.0
+    shown_status: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive fields read by every pipeline summary."""
+        self.shown_status = self._compute_shown_status()
 
     @property
     def is_delayed(self) -> bool:
@@ -100,8 +128,7 @@ class Pipeline:
         """Check if pipeline completed successfully."""
         return self.status == PipelineStatus.SUCCESSFUL
 
-    @property
-    def shown_status(self) -> str:
+    def _compute_shown_status(self) -> str:
         """
         Get the display status for the pipeline bar chart.
 
@@ -114,7 +141,7 @@ class Pipeline:
         - Use the pipeline_transformed_status (mapped to status)
 
         Returns:
-            Status string: 'Succeeded', 'Delayed', or 'Failed'
+            Status string: 'Succeeded', 'Delayed', 'Failed' or 'Not Applicable'
         """
         if self.platform == PlatformId.EDLAP:
             if self.original_status == "Failed":
@@ -149,8 +176,25 @@ class Pipeline:
             "delay_seconds": self.delay_seconds,
         }
 
+    @staticmethod
+    def parse_platform(platform_str: str) -> PlatformId:
+        """
+        Map a CSV platform_id value to a PlatformId.
+
+        Args:
+            platform_str: Raw platform_id value (e.g. "EDLAP", "SAP_BW")
+
+        Returns:
+            Matching PlatformId, or EDLAP if the value is not recognized
+        """
+        return (
+            _PLATFORM_MAP.get(platform_str)
+            or PlatformId.lookup(platform_str)
+            or PlatformId.EDLAP
+        )
+
     @classmethod
-    def from_csv_row(cls, row: dict) -> Optional["Pipeline"]:
+    def from_csv_row(cls, row: dict) -> "Pipeline":
         """
         Create a Pipeline from a CSV row.
 
@@ -158,43 +202,31 @@ class Pipeline:
             row: Dictionary with CSV column values
 
         Returns:
-            Pipeline instance or None if parsing fails
+            Pipeline instance
         """
-        try:
-            # Map platform_id
-            platform_map = {
-                "EDLAP": PlatformId.EDLAP,
-                "SAP_BW": PlatformId.SAPBW,
-            }
-            platform_str = row.get("platform_id", "")
-            platform = platform_map.get(platform_str)
-            if platform is None:
-                try:
-                    platform = PlatformId.from_string(platform_str)
-                except ValueError:
-                    platform = PlatformId.EDLAP
-
-            # Parse delay time
-            delay_qty = row.get("pipeline_delay_time_qty", "")
+        platform = cls.parse_platform(row.get("platform_id") or "")
+
+        # Parse delay time
+        delay_qty = row.get("pipeline_delay_time_qty") or ""
+        delay_seconds = 0.0
+        if delay_qty and delay_qty != "null":
             try:
-                delay_seconds = float(delay_qty) if delay_qty and delay_qty != "null" else 0.0
-            except (ValueError, TypeError):
+                delay_seconds = float(delay_qty)
+            except ValueError:
                 delay_seconds = 0.0
 
-            # Parse status
-            transformed_status = row.get("pipeline_transformed_status", "")
-            original_status = row.get("pipeline_original_status", "")
-            status = PipelineStatus.from_string(transformed_status, original_status)
-
-            return cls(
-                platform=platform,
-                pipeline_id=row.get("pipeline_id", ""),
-                status=status,
-                original_status=original_status,
-                snapshot_ts=row.get("snapshot_ts", ""),
-                end_ts=row.get("pipeline_end_ts", ""),
-                expected_end_ts=row.get("pipeline_expected_end_ts", ""),
-                delay_seconds=delay_seconds,
-            )
-        except Exception:
-            return None
+        # Parse status
+        transformed_status = row.get("pipeline_transformed_status") or ""
+        original_status = row.get("pipeline_original_status") or ""
+        status = PipelineStatus.from_string(transformed_status, original_status)
+
+        return cls(
+            platform=platform,
+            pipeline_id=row.get("pipeline_id") or "",
+            status=status,
+            original_status=original_status,
+            snapshot_ts=row.get("snapshot_ts") or "",
+            end_ts=row.get("pipeline_end_ts") or "",
+            expected_end_ts=row.get("pipeline_expected_end_ts") or "",
+            delay_seconds=delay_seconds,
+        )
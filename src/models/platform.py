@@ -21,18 +21,26 @@ class PlatformId(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "PlatformId":
         """Convert string to PlatformId, handling common aliases."""
-        mapping = {
-            "edlap": cls.EDLAP,
-            "sap_bw": cls.SAPBW,
-            "sapbw": cls.SAPBW,
-            "sap bw": cls.SAPBW,
-            "tableau": cls.TABLEAU,
-            "alteryx": cls.ALTERYX,
-        }
-        normalized = value.lower().strip()
-        if normalized in mapping:
-            return mapping[normalized]
-        raise ValueError(f"Unknown platform: {value}")
+        platform = cls.lookup(value)
+        if platform is None:
+            raise ValueError(f"Unknown platform: {value}")
+        return platform
+
+    @classmethod
+    def lookup(cls, value: str) -> Optional["PlatformId"]:
+        """Convert string to PlatformId like from_string, or None if unknown."""
+        return _PLATFORM_ALIASES.get(value.lower().strip())
+
+
+# Platform ids by normalized (lowercased, stripped) name or alias
+_PLATFORM_ALIASES = {
+    "edlap": PlatformId.EDLAP,
+    "sap_bw": PlatformId.SAPBW,
+    "sapbw": PlatformId.SAPBW,
+    "sap bw": PlatformId.SAPBW,
+    "tableau": PlatformId.TABLEAU,
+    "alteryx": PlatformId.ALTERYX,
+}
 
 
 class PlatformStatus(str, Enum):
@@ -56,7 +64,7 @@ class PlatformTrend(str, Enum):
     FALLING = "falling"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformMetric:
     """A single metric displayed on a platform card."""
 
@@ -65,7 +73,7 @@ class PlatformMetric:
     threshold: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformMetrics:
     """Collection of metrics for a platform card."""
 
@@ -74,7 +82,7 @@ class PlatformMetrics:
     tertiary: PlatformMetric
 
 
-@dataclass
+@dataclass(slots=True)
 class Platform:
     """
     Represents a monitored platform with its current health status.
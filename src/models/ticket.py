@@ -4,9 +4,13 @@ Ticket data models.
 Defines the Ticket entity and related types for ServiceNow integration.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import List, Mapping, Optional
+
+import numpy as np
 
 from .platform import PlatformId
 
@@ -21,13 +25,43 @@ class TicketPriority(str, Enum):
     @classmethod
     def from_task_type(cls, task_type: str) -> "TicketPriority":
         """Derive priority from ServiceNow task type code."""
-        mapping = {
-            "INC": cls.HIGH,  # Incidents are high priority
-            "PRB": cls.MEDIUM,  # Problems are medium priority
-            "REQ": cls.LOW,  # Requests are low priority
-            "RITM": cls.LOW,  # Request items are low priority
-        }
-        return mapping.get(task_type.upper()[:3], cls.LOW)
+        return _TASK_PRIORITY.get(task_type.upper()[:3], cls.LOW)
+
+    @property
+    def rank(self) -> int:
+        """Sort rank of the priority (0 is most urgent)."""
+        return _PRIORITY_RANK[self]
+
+
+_PRIORITY_RANK = {
+    TicketPriority.HIGH: 0,
+    TicketPriority.MEDIUM: 1,
+    TicketPriority.LOW: 2,
+}
+
+# Priority by ServiceNow task type code prefix
+_TASK_PRIORITY = {
+    "INC": TicketPriority.HIGH,  # Incidents are high priority
+    "PRB": TicketPriority.MEDIUM,  # Problems are medium priority
+    "REQ": TicketPriority.LOW,  # Requests are low priority
+    "RITM": TicketPriority.LOW,  # Request items are low priority
+}
+
+# Ticket types by ServiceNow ticket number prefix
+_TICKET_TYPES = {
+    "INC": "Incident",
+    "PRB": "Problem",
+    "RITM": "Request Item",
+    "REQ": "Request",
+}
+
+# Internal platform ids by tickets CSV platform_id value
+_PLATFORM_MAP = {
+    "EDLAP": PlatformId.EDLAP,
+    "SAP_BW": PlatformId.SAPBW,
+    "Tableau": PlatformId.TABLEAU,
+    "Alteryx": PlatformId.ALTERYX,
+}
 
 
 class TicketStatus(str, Enum):
@@ -39,8 +73,17 @@ class TicketStatus(str, Enum):
     RESOLVED = "Resolved"
     CLOSED = "Closed"
 
+    @classmethod
+    def from_string(cls, value: str) -> "TicketStatus":
+        """Convert a ServiceNow state description, defaulting to OPEN."""
+        return _STATUS_LOOKUP.get(value, cls.OPEN)
+
 
-@dataclass
+# Statuses by value, looked up without going through Enum.__call__
+_STATUS_LOOKUP = {status.value: status for status in TicketStatus}
+
+
+@dataclass(slots=True)
 class Ticket:
     """
     Represents a ServiceNow ticket.
@@ -65,6 +108,8 @@ class Ticket:
         is_breached: Whether SLA has been breached
         country: Country context for the ticket
         service: Service category
+        age_days: Age in whole days, parsed from age (derived)
+        ticket_type: Ticket type from the ID prefix, e.g. "Incident" (derived)
     """
 
     id: str
@@ -83,6 +128,8 @@ class Ticket:
     is_breached: bool = False
     country: str = "Unknown"
     service: str = ""
+    age_days: int = field(init=False, repr=False, compare=False)
+    ticket_type: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate and normalize fields after initialization."""
@@ -90,26 +137,30 @@ class Ticket:
         if len(self.title) > 80:
             self.title = self.title[:77] + "..."
 
-    @property
-    def age_days(self) -> int:
-        """Parse age string to get days as integer."""
+        # Derived once here, as they are read for every row of every table
         try:
-            return int(self.age.replace("d", "").replace("?", "0"))
+            self.age_days = int(self.age.replace("d", "").replace("?", "0"))
         except ValueError:
-            return 0
+            self.age_days = 0
 
-    @property
-    def ticket_type(self) -> str:
-        """Get the ticket type from the ID prefix."""
-        if self.id.startswith("INC"):
-            return "Incident"
-        elif self.id.startswith("PRB"):
-            return "Problem"
-        elif self.id.startswith("RITM"):
-            return "Request Item"
-        elif self.id.startswith("REQ"):
-            return "Request"
-        return "Unknown"
+        ticket_type = _TICKET_TYPES.get(self.id[:3]) or _TICKET_TYPES.get(self.id[:4])
+        self.ticket_type = ticket_type or "Unknown"
+
+    @staticmethod
+    def parse_platform(platform_str: str) -> Optional[PlatformId]:
+        """
+        Map a CSV platform_id value to a PlatformId.
+
+        Args:
+            platform_str: Raw platform_id value (e.g. "EDLAP", "Tableau")
+
+        Returns:
+            Matching PlatformId, EDLAP if the value is empty, or None if the
+            value is not a known platform
+        """
+        if not platform_str:
+            return PlatformId.EDLAP
+        return _PLATFORM_MAP.get(platform_str) or PlatformId.lookup(platform_str)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for Dash components."""
@@ -133,83 +184,137 @@ class Ticket:
         }
 
     @classmethod
-    def from_csv_row(cls, row: dict) -> Optional["Ticket"]:
+    def from_csv_row(cls, row: dict, now: Optional[datetime] = None) -> Optional["Ticket"]:
         """
         Create a Ticket from a CSV row (ServiceNow export format).
 
         Args:
             row: Dictionary with CSV column values
+            now: Reference time for the ticket age (defaults to the current
+                UTC time; pass one value when parsing many rows)
 
         Returns:
-            Ticket instance or None if parsing fails
+            Ticket instance or None if the row has no ticket id or an
+            unknown platform
         """
-        from datetime import datetime
+        ticket_id = _cell(row, "service_task_id", "")
+        if not ticket_id:
+            return None
 
-        try:
-            # Map platform_id to our internal platform ids
-            platform_map = {
-                "EDLAP": PlatformId.EDLAP,
-                "SAP_BW": PlatformId.SAPBW,
-                "Tableau": PlatformId.TABLEAU,
-                "Alteryx": PlatformId.ALTERYX,
-            }
-            platform_str = row.get("platform_id", "")
-            platform = platform_map.get(
-                platform_str,
-                PlatformId.from_string(platform_str) if platform_str else PlatformId.EDLAP,
-            )
-
-            # Parse created timestamp
-            created_ts = row.get("service_task_created_ts", "")
-            created_date = created_ts[:10] if created_ts else ""
-
-            # Calculate age in days
-            age_str = "0d"
-            if created_ts:
-                try:
-                    created_dt = datetime.fromisoformat(created_ts.replace("Z", "+00:00"))
-                    age_days = (datetime.now(created_dt.tzinfo) - created_dt).days
-                    age_str = f"{age_days}d"
-                except (ValueError, TypeError):
-                    age_str = "?d"
-
-            # Determine priority from task type
-            task_type = row.get("service_task_type_code", "REQ")
-            priority = TicketPriority.from_task_type(task_type)
-
-            # Breached tickets are always high priority
-            is_breached = row.get("is_breached", "false").lower() == "true"
-            if is_breached:
-                priority = TicketPriority.HIGH
-
-            # Parse status
-            status_str = row.get("service_task_state_desc", "Open")
-            try:
-                status = TicketStatus(status_str)
-            except ValueError:
-                status = TicketStatus.OPEN
-
-            # Format last updated
-            snapshot_ts = row.get("snapshot_ts", "")
-            last_updated = snapshot_ts[:16].replace("T", " ") if snapshot_ts else ""
-
-            return cls(
-                id=row.get("service_task_id", ""),
-                platform=platform,
-                title=row.get("service_task_desc", "")[:80],
-                description=row.get("service_task_desc", ""),
-                priority=priority,
-                status=status,
-                owner=row.get("service_task_assignment_group_desc", "Unassigned"),
-                requested_by=row.get("requested_by", "Hidden"),
-                assigned_to=row.get("assigned_to", "Hidden"),
-                created_date=created_date,
-                last_updated=last_updated,
-                age=age_str,
-                is_active=row.get("is_active", "true").lower() == "true",
-                is_breached=is_breached,
-                country=row.get("country", "Unknown"),
-                service=row.get("service_task_service", ""),
-            )
-        except Exception:
+        platform = cls.parse_platform(_cell(row, "platform_id", ""))
+        if platform is None:
             return None
+
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        # Parse created timestamp
+        created_ts = _cell(row, "service_task_created_ts", "")
+        created_date = created_ts[:10]
+
+        # Calculate age in days; "?d" unless the value starts with YYYY-MM-DD
+        age_str = "0d"
+        if created_ts:
+            age_str = "?d"
+            if len(created_ts) >= 10 and created_ts[4] == "-" and created_ts[7] == "-":
+                try:
+                    created_dt = datetime.fromisoformat(created_ts)
+                except ValueError:
+                    created_dt = None
+                if created_dt is not None:
+                    # Timestamps without an offset are taken as UTC
+                    if created_dt.tzinfo is None:
+                        created_dt = created_dt.replace(tzinfo=timezone.utc)
+                    age_str = f"{(now - created_dt).days}d"
+
+        # Determine priority from task type
+        priority = TicketPriority.from_task_type(_cell(row, "service_task_type_code", "REQ"))
+
+        # Breached tickets are always high priority
+        is_breached = _cell(row, "is_breached", "false").lower() == "true"
+        if is_breached:
+            priority = TicketPriority.HIGH
+
+        # Parse status
+        status = TicketStatus.from_string(_cell(row, "service_task_state_desc", "Open"))
+
+        # Format last updated
+        snapshot_ts = _cell(row, "snapshot_ts", "")
+        last_updated = snapshot_ts[:16].replace("T", " ")
+
+        description = _cell(row, "service_task_desc", "")
+
+        return cls(
+            id=ticket_id,
+            platform=platform,
+            title=description[:80],
+            description=description,
+            priority=priority,
+            status=status,
+            owner=sys.intern(_cell(row, "service_task_assignment_group_desc", "Unassigned")),
+            requested_by=_cell(row, "requested_by", "Hidden"),
+            assigned_to=_cell(row, "assigned_to", "Hidden"),
+            created_date=created_date,
+            last_updated=last_updated,
+            age=age_str,
+            is_active=_cell(row, "is_active", "true").lower() == "true",
+            is_breached=is_breached,
+            country=sys.intern(_cell(row, "country", "Unknown")),
+            service=sys.intern(_cell(row, "service_task_service", "")),
+        )
+
+
+def _cell(row: Mapping[str, Optional[str]], column: str, default: str) -> str:
+    """Get a CSV cell value, or the default if the column is missing or None."""
+    value = row.get(column)
+    return default if value is None else value
+
+
+@dataclass(slots=True)
+class TicketColumns:
+    """
+    Column-oriented view of a ticket collection.
+
+    The fields used for aggregation and sorting are stored as parallel
+    NumPy arrays, so per-platform counts and priority/age ordering run as
+    vectorized operations. The Ticket objects are kept alongside and are
+    only serialized for the rows that are actually returned.
+
+    Attributes:
+        tickets: The underlying Ticket objects (row i matches index i)
+        platforms: Platform id per ticket
+        priorities: Priority rank per ticket (see TicketPriority.rank)
+        ages_days: Ticket age in days
+        is_active: Whether the ticket is still active
+        is_breached: Whether the ticket SLA has been breached
+    """
+
+    tickets: List[Ticket]
+    platforms: np.ndarray
+    priorities: np.ndarray
+    ages_days: np.ndarray
+    is_active: np.ndarray
+    is_breached: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tickets)
+
+    @classmethod
+    def from_tickets(cls, tickets: List[Ticket]) -> "TicketColumns":
+        """
+        Build the column arrays from a list of tickets.
+
+        Args:
+            tickets: Ticket objects to index
+
+        Returns:
+            TicketColumns over the given tickets
+        """
+        return cls(
+            tickets=tickets,
+            platforms=np.array([t.platform.value for t in tickets], dtype=str),
+            priorities=np.array([t.priority.rank for t in tickets], dtype=np.int8),
+            ages_days=np.array([t.age_days for t in tickets], dtype=np.int32),
+            is_active=np.array([t.is_active for t in tickets], dtype=bool),
+            is_breached=np.array([t.is_breached for t in tickets], dtype=bool),
+        )
@@ -17,11 +17,12 @@ Usage:
 """
 
 from .base import DataProvider
-from .csv_provider import CSVDataProvider
+from .csv_provider import CSVDataProvider, clear_csv_cache
 from .factory import get_data_provider
 
 __all__ = [
     "DataProvider",
     "CSVDataProvider",
     "get_data_provider",
+    "clear_csv_cache",
 ]
@@ -7,9 +7,13 @@ data source.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional, Tuple
 
-from models import Pipeline, Ticket
+import numpy as np
+
+from models import Pipeline, Ticket, TicketColumns
 from models.performance import HistoricalStats, PipelineSummary
 
 
@@ -83,6 +87,25 @@ class DataProvider(ABC):
         """
         pass
 
+    def load_all(self) -> Tuple[List[Ticket], List[Pipeline], Optional[dict]]:
+        """
+        Load tickets, pipelines and the latest B/W performance record concurrently.
+
+        Each source is loaded on its own thread, so reading one file (or
+        waiting on a network share) overlaps with parsing the others. Only
+        the latest B/W record is fetched, through get_latest_bw_performance(),
+        so providers that can read it without loading the full history
+        still do.
+
+        Returns:
+            Tuple of (tickets, pipelines, latest B/W performance record or None)
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            tickets = executor.submit(self.load_tickets)
+            pipelines = executor.submit(self.load_pipelines)
+            latest_bw = executor.submit(self.get_latest_bw_performance)
+            return tickets.result(), pipelines.result(), latest_bw.result()
+
     def get_active_tickets(self) -> List[Ticket]:
         """
         Load and filter to only active tickets.
@@ -93,67 +116,114 @@ class DataProvider(ABC):
         tickets = self.load_tickets()
         return [t for t in tickets if t.is_active]
 
+    def get_ticket_columns(self) -> TicketColumns:
+        """
+        Load tickets into a column-oriented view for vectorized aggregation.
+
+        Returns:
+            TicketColumns over all tickets
+        """
+        return TicketColumns.from_tickets(self.load_tickets())
+
+    def load_tickets_by_platform(self) -> Dict[str, List[Ticket]]:
+        """
+        Load all tickets grouped by platform in a single pass.
+
+        Returns:
+            Mapping of platform ID to that platform's tickets
+        """
+        grouped: Dict[str, List[Ticket]] = defaultdict(list)
+        for ticket in self.load_tickets():
+            grouped[ticket.platform.value].append(ticket)
+        return dict(grouped)
+
+    def load_pipelines_by_platform(self) -> Dict[str, List[Pipeline]]:
+        """
+        Load all pipeline records grouped by platform in a single pass.
+
+        Returns:
+            Mapping of platform ID to that platform's pipelines
+        """
+        grouped: Dict[str, List[Pipeline]] = defaultdict(list)
+        for pipeline in self.load_pipelines():
+            grouped[pipeline.platform.value].append(pipeline)
+        return dict(grouped)
+
     def get_tickets_by_platform(self, platform_id: str) -> List[Ticket]:
         """
         Load tickets filtered to a specific platform.
 
+        Served from the per-platform grouping, so providers that cache it
+        answer repeated calls without rescanning all tickets.
+
         Args:
             platform_id: Platform ID to filter by
 
         Returns:
             List of Ticket objects for the platform
         """
-        tickets = self.load_tickets()
-        return [t for t in tickets if t.platform.value == platform_id]
+        return list(self.load_tickets_by_platform().get(platform_id, []))
 
-    def get_pipeline_summary(self, platform_id: str) -> PipelineSummary:
+    def get_pipeline_summary(
+        self, platform_id: str, pipelines: Optional[List[Pipeline]] = None
+    ) -> PipelineSummary:
         """
         Get pipeline status summary for a platform.
 
-        Uses the shown_status property which applies platform-specific logic:
+        Counts the shown_status derived at load, which applies platform-specific logic:
         - EDLAP: Failed if original_status='Failed', Delayed if Succeeded with delay>0
         - SAP_BW: Uses pipeline_transformed_status directly
 
         Args:
             platform_id: Platform ID to summarize
+            pipelines: Already loaded pipelines (loaded from the source if None)
 
         Returns:
             PipelineSummary with counts by status
         """
-        pipelines = self.load_pipelines()
-        platform_pipelines = [p for p in pipelines if p.platform.value == platform_id]
+        if pipelines is None:
+            platform_pipelines = self.load_pipelines_by_platform().get(platform_id, [])
+        else:
+            platform_pipelines = [p for p in pipelines if p.platform.value == platform_id]
 
         if not platform_pipelines:
             return PipelineSummary()
 
         # Use shown_status for counting (applies platform-specific logic)
+        counts = Counter(p.shown_status for p in platform_pipelines)
         return PipelineSummary(
-            successful=sum(1 for p in platform_pipelines if p.shown_status == "Succeeded"),
-            delayed=sum(1 for p in platform_pipelines if p.shown_status == "Delayed"),
-            failed=sum(1 for p in platform_pipelines if p.shown_status == "Failed"),
-            not_applicable=sum(1 for p in platform_pipelines if p.shown_status == "Not Applicable"),
+            successful=counts["Succeeded"],
+            delayed=counts["Delayed"],
+            failed=counts["Failed"],
+            not_applicable=counts["Not Applicable"],
         )
 
-    def get_bw_memory_stats(self) -> HistoricalStats:
+    def get_bw_memory_stats(self, records: Optional[List[dict]] = None) -> HistoricalStats:
         """
         Get average and peak memory usage from B/W performance data.
 
+        Args:
+            records: Already loaded B/W performance records (loaded from the source if None)
+
         Returns:
             HistoricalStats with average and peak values in TB
         """
-        records = self.load_bw_performance()
+        if records is None:
+            records = self.load_bw_performance()
 
         if not records:
             # Fallback if no data available
             return HistoricalStats(average=19.5, peak=21.9)
 
-        memory_values = [r["memory_usage_tb"] for r in records if r.get("memory_usage_tb")]
+        memory_values = np.fromiter(
+            (r["memory_usage_tb"] for r in records if r.get("memory_usage_tb")), dtype=np.float32
+        )
 
-        if not memory_values:
+        if memory_values.size == 0:
             return HistoricalStats(average=19.5, peak=21.9)
 
-        avg_memory = sum(memory_values) / len(memory_values)
-        peak_memory = max(memory_values)
+        avg_memory = float(memory_values.mean(dtype=np.float64))
+        peak_memory = float(memory_values.max())
 
         return HistoricalStats(
             average=round(avg_memory, 2),
@@ -170,6 +240,19 @@ class DataProvider(ABC):
         records = self.load_bw_performance()
         return records[-1] if records else None
 
+    def get_data_version(self) -> Hashable:
+        """
+        Get a value that changes whenever the underlying data changes.
+
+        Used as part of cache keys so cached results are discarded as soon
+        as new data arrives. Providers that cannot detect changes return
+        None and rely on cache expiry alone.
+
+        Returns:
+            Hashable data version, or None if unknown
+        """
+        return None
+
     @abstractmethod
     def is_available(self) -> bool:
         """
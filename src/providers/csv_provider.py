@@ -12,16 +12,145 @@ job that exports the latest data.
 
 import csv
 import logging
+import os
+import sys
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
 
 from config import settings
-from models import Pipeline, Ticket
+from models import Pipeline, PipelineStatus, Ticket, TicketPriority, TicketStatus
+from models.performance import HistoricalStats, PipelineSummary
 
 from .base import DataProvider
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Columns read from the B/W performance CSV, in record order
+_BW_PERFORMANCE_COLUMNS = (
+    "snapshot_ts",
+    "storage_usage_tb",
+    "storage_capacity_tb",
+    "memory_usage_tb",
+    "memory_capacity_tb",
+    "ymd",
+)
+
+# Numeric columns of the B/W performance CSV
+_BW_NUMERIC_COLUMNS = _BW_PERFORMANCE_COLUMNS[1:5]
+
+# Columns read from the pipelines CSV (missing columns are treated as empty)
+_PIPELINE_COLUMNS = (
+    "pipeline_id",
+    "platform_id",
+    "pipeline_transformed_status",
+    "pipeline_original_status",
+    "pipeline_delay_time_qty",
+    "pipeline_end_ts",
+    "pipeline_expected_end_ts",
+    "snapshot_ts",
+)
+
+# Columns read from the tickets CSV, with the value used when a column is missing
+_TICKET_COLUMNS = {
+    "service_task_id": "",
+    "platform_id": "",
+    "service_task_desc": "",
+    "service_task_type_code": "REQ",
+    "service_task_state_desc": "Open",
+    "service_task_assignment_group_desc": "Unassigned",
+    "requested_by": "Hidden",
+    "assigned_to": "Hidden",
+    "service_task_created_ts": "",
+    "snapshot_ts": "",
+    "is_active": "true",
+    "is_breached": "false",
+    "country": "Unknown",
+    "service_task_service": "",
+}
+
+# Block size used when scanning backwards for the last line of a CSV
+_TAIL_BLOCK_SIZE = 4096
+
+# Results derived from CSV files, keyed by (path, result kind), with the
+# file's signature at the time they were computed
+_CSV_CACHE: Dict[Tuple[Path, str], Tuple[Tuple[int, int], Any]] = {}
+
+
+def clear_csv_cache() -> None:
+    """
+    Discard all cached CSV load results.
+
+    The next load of each file re-reads and re-parses it, even if the file
+    has not changed since it was cached.
+    """
+    _CSV_CACHE.clear()
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """
+    Identify the current version of a file.
+
+    The size is included because modification times on some mounted
+    file shares are too coarse to tell quick successive writes apart.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Tuple of (st_mtime_ns, st_size)
+
+    Raises:
+        OSError: If the file cannot be accessed
+    """
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse_bw_row(row: List[str], indices: Sequence[int]) -> Optional[dict]:
+    """
+    Build a B/W performance record from a raw CSV row.
+
+    Args:
+        row: Row values from csv.reader
+        indices: Positions of the _BW_PERFORMANCE_COLUMNS fields in the row
+
+    Returns:
+        Performance record dictionary, or None if the row is invalid
+    """
+    ts_i, storage_i, storage_cap_i, memory_i, memory_cap_i, ymd_i = indices
+    try:
+        return {
+            "snapshot_ts": row[ts_i],
+            "storage_usage_tb": float(row[storage_i]),
+            "storage_capacity_tb": float(row[storage_cap_i]),
+            "memory_usage_tb": float(row[memory_i]),
+            "memory_capacity_tb": float(row[memory_cap_i]),
+            "ymd": row[ymd_i],
+        }
+    except (ValueError, IndexError) as e:
+        logger.debug(f"Skipping invalid B/W performance row: {e}")
+        return None
+
+
+def _is_float(value: str) -> bool:
+    """Whether float() accepts a CSV cell value."""
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _interned(column: pd.Series) -> pd.Series:
+    """Replace each value of a text column with its interned string."""
+    return column.map({v: sys.intern(v) for v in column.unique()})
+
 
 class CSVDataProvider(DataProvider):
     """
@@ -82,37 +211,126 @@ class CSVDataProvider(DataProvider):
         """Get the full path to a CSV file."""
         return self.data_directory / filename
 
-    def _read_csv(self, filename: str) -> List[dict]:
+    def _load_cached(self, filename: str, parse: Callable[[], T], kind: str = "records") -> T:
+        """
+        Return a result derived from a CSV file, recomputing only when it changes.
+
+        Results are cached per file path and kind, and reused while the
+        file's modification time and size are unchanged. Cached values are
+        shared between callers and must be treated as read-only.
+
+        Args:
+            filename: Name of the CSV file
+            parse: Callable that reads the file and computes the result
+            kind: Name distinguishing different results derived from one file
+
+        Returns:
+            The parsed or derived result
+        """
+        file_path = self._get_file_path(filename)
+        try:
+            signature = _file_signature(file_path)
+        except OSError:
+            return parse()
+
+        key = (file_path, kind)
+        cached = _CSV_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            result: T = cached[1]
+            return result
+
+        result = parse()
+        _CSV_CACHE[key] = (signature, result)
+        return result
+
+    def _read_csv_last_row(self, filename: str) -> Tuple[Dict[str, int], Optional[List[str]]]:
         """
-        Read a CSV file and return rows as dictionaries.
+        Read only the header and the last non-blank row of a CSV file.
+
+        The file is scanned backwards from the end in fixed-size blocks, so
+        the cost does not grow with the number of rows.
 
         Args:
             filename: Name of the CSV file
 
         Returns:
-            List of row dictionaries, or empty list on error
+            Tuple of (column index map, last data row), or empty values on error
         """
         file_path = self._get_file_path(filename)
 
         if not file_path.exists():
             logger.warning(f"CSV file not found: {file_path}")
-            return []
+            return {}, None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-                logger.debug(f"Loaded {len(rows)} rows from {filename}")
-                return rows
+            with open(file_path, "rb") as f:
+                header_line = f.readline()
+                data_start = f.tell()
+                end = f.seek(0, os.SEEK_END)
+
+                tail = b""
+                pos = end
+                while pos > data_start:
+                    pos = max(data_start, pos - _TAIL_BLOCK_SIZE)
+                    f.seek(pos)
+                    tail = f.read(end - pos)
+                    # A complete last line needs a newline before it
+                    if b"\n" in tail.rstrip() or pos == data_start:
+                        break
+
+            header = next(csv.reader([header_line.decode("utf-8")]), None)
+            if header is None:
+                return {}, None
+            columns = {name: i for i, name in enumerate(header)}
+
+            last_lines = tail.decode("utf-8").strip().splitlines()
+            if not last_lines:
+                return columns, None
+            return columns, next(csv.reader([last_lines[-1]]))
         except csv.Error as e:
             logger.error(f"CSV parsing error in {filename}: {e}")
-            return []
+            return {}, None
         except UnicodeDecodeError as e:
             logger.error(f"Encoding error in {filename}: {e}")
-            return []
+            return {}, None
         except OSError as e:
             logger.error(f"Error reading {filename}: {e}")
-            return []
+            return {}, None
+
+    def _read_csv_frame(self, filename: str) -> Optional[pd.DataFrame]:
+        """
+        Read a CSV file into a DataFrame of raw strings.
+
+        Every column is read as text with empty cells kept as "", matching
+        what csv.reader returns, so parsing rules stay with the caller.
+
+        Args:
+            filename: Name of the CSV file
+
+        Returns:
+            DataFrame with one row per non-blank line, or None on error
+        """
+        file_path = self._get_file_path(filename)
+
+        if not file_path.exists():
+            logger.warning(f"CSV file not found: {file_path}")
+            return None
+
+        try:
+            df = pd.read_csv(file_path, dtype=str, keep_default_na=False, encoding="utf-8")
+            logger.debug(f"Loaded {len(df)} rows from {filename}")
+            return df
+        except pd.errors.EmptyDataError:
+            return None
+        except pd.errors.ParserError as e:
+            logger.error(f"CSV parsing error in {filename}: {e}")
+            return None
+        except UnicodeDecodeError as e:
+            logger.error(f"Encoding error in {filename}: {e}")
+            return None
+        except OSError as e:
+            logger.error(f"Error reading {filename}: {e}")
+            return None
 
     def load_tickets(self) -> List[Ticket]:
         """
@@ -133,17 +351,81 @@ class CSVDataProvider(DataProvider):
         Returns:
             List of Ticket objects
         """
-        rows = self._read_csv(self.tickets_file)
-        tickets = []
+        return self._load_cached(self.tickets_file, self._parse_tickets)
 
-        for row in rows:
-            ticket = Ticket.from_csv_row(row)
-            if ticket is not None:
-                tickets.append(ticket)
+    def _parse_tickets(self) -> List[Ticket]:
+        """
+        Read and parse the tickets CSV file.
+
+        Columns are converted as a whole instead of row by row: timestamps
+        via pd.to_datetime, flags and text slices via the .str accessor, and
+        platforms, priorities and statuses once per distinct value. Owner,
+        country and service strings are interned, so each distinct value is
+        held once however many tickets share it. Rows without a ticket id or
+        with an unknown platform are skipped, as in Ticket.from_csv_row.
+        """
+        df = self._read_csv_frame(self.tickets_file)
+        if df is None or df.empty:
+            return []
+
+        row_count = len(df)
+        for column, default in _TICKET_COLUMNS.items():
+            if column not in df:
+                df[column] = default
+
+        platform_ids = df["platform_id"]
+        platforms = platform_ids.map({v: Ticket.parse_platform(v) for v in platform_ids.unique()})
+        valid = platforms.notna() & (df["service_task_id"] != "")
+        df = df[valid]
+        platforms = platforms[valid]
+
+        # Age in whole days; "?d" if the timestamp is unparseable, "0d" if missing
+        created_ts = df["service_task_created_ts"]
+        created = pd.to_datetime(created_ts, format="ISO8601", utc=True, errors="coerce")
+        age_days = (pd.Timestamp.now(tz="UTC") - created).dt.days.astype("Int64")
+        ages = (age_days.astype(str) + "d").where(created.notna(), "?d")
+        ages = ages.where(created_ts != "", "0d")
+
+        # Breached tickets are always high priority
+        is_breached = (df["is_breached"].str.lower() == "true").tolist()
+        type_codes = df["service_task_type_code"]
+        type_priorities = {v: TicketPriority.from_task_type(v) for v in type_codes.unique()}
+        priorities = [
+            TicketPriority.HIGH if breached else type_priorities[code]
+            for code, breached in zip(type_codes, is_breached)
+        ]
+
+        state_descs = df["service_task_state_desc"]
+        statuses = state_descs.map({v: TicketStatus.from_string(v) for v in state_descs.unique()})
+
+        descriptions = df["service_task_desc"]
+
+        # Columns in Ticket field order
+        tickets = [
+            Ticket(*values)
+            for values in zip(
+                df["service_task_id"],
+                platforms,
+                descriptions.str[:80],
+                descriptions,
+                priorities,
+                statuses,
+                _interned(df["service_task_assignment_group_desc"]),
+                df["requested_by"],
+                df["assigned_to"],
+                created_ts.str[:10],
+                df["snapshot_ts"].str[:16].str.replace("T", " ", regex=False),
+                ages,
+                (df["is_active"].str.lower() == "true").tolist(),
+                is_breached,
+                _interned(df["country"]),
+                _interned(df["service_task_service"]),
+            )
+        ]
 
-        if rows and not tickets:
-            logger.warning(f"No valid tickets parsed from {len(rows)} rows in {self.tickets_file}")
-        elif tickets:
+        if not tickets:
+            logger.warning(f"No valid tickets parsed from {row_count} rows in {self.tickets_file}")
+        else:
             logger.info(f"Loaded {len(tickets)} tickets from {self.tickets_file}")
 
         return tickets
@@ -165,23 +447,120 @@ class CSVDataProvider(DataProvider):
         Returns:
             List of Pipeline objects
         """
-        rows = self._read_csv(self.pipelines_file)
-        pipelines = []
+        return self._load_cached(self.pipelines_file, self._parse_pipelines)
 
-        for row in rows:
-            pipeline = Pipeline.from_csv_row(row)
-            if pipeline is not None:
-                pipelines.append(pipeline)
+    def _parse_pipelines(self) -> List[Pipeline]:
+        """
+        Read and parse the pipelines CSV file.
 
-        if rows and not pipelines:
+        Columns are converted as a whole instead of row by row: delays via
+        pd.to_numeric, platforms and statuses once per distinct value.
+        Every row is kept, as in Pipeline.from_csv_row.
+        """
+        df = self._read_csv_frame(self.pipelines_file)
+        if df is None or df.empty:
+            return []
+
+        row_count = len(df)
+        df = df.reindex(columns=_PIPELINE_COLUMNS, fill_value="")
+
+        platform_ids = df["platform_id"]
+        platforms = platform_ids.map({v: Pipeline.parse_platform(v) for v in platform_ids.unique()})
+        delays = pd.to_numeric(df["pipeline_delay_time_qty"], errors="coerce").fillna(0.0)
+        statuses = [
+            PipelineStatus.from_string(status, original)
+            for status, original in zip(
+                df["pipeline_transformed_status"], df["pipeline_original_status"]
+            )
+        ]
+
+        # Columns in Pipeline field order
+        pipelines = [
+            Pipeline(*values)
+            for values in zip(
+                platforms,
+                df["pipeline_id"],
+                statuses,
+                df["pipeline_original_status"],
+                df["snapshot_ts"],
+                df["pipeline_end_ts"],
+                df["pipeline_expected_end_ts"],
+                delays.tolist(),
+            )
+        ]
+
+        if not pipelines:
             logger.warning(
-                f"No valid pipelines parsed from {len(rows)} rows in {self.pipelines_file}"
+                f"No valid pipelines parsed from {row_count} rows in {self.pipelines_file}"
             )
-        elif pipelines:
+        else:
             logger.info(f"Loaded {len(pipelines)} pipelines from {self.pipelines_file}")
 
         return pipelines
 
+    def load_tickets_by_platform(self) -> Dict[str, List[Ticket]]:
+        """
+        Load all tickets grouped by platform, cached per file version.
+
+        Returns:
+            Mapping of platform ID to that platform's tickets
+        """
+        return self._load_cached(
+            self.tickets_file, super().load_tickets_by_platform, kind="by_platform"
+        )
+
+    def load_pipelines_by_platform(self) -> Dict[str, List[Pipeline]]:
+        """
+        Load all pipeline records grouped by platform, cached per file version.
+
+        Returns:
+            Mapping of platform ID to that platform's pipelines
+        """
+        return self._load_cached(
+            self.pipelines_file, super().load_pipelines_by_platform, kind="by_platform"
+        )
+
+    def get_pipeline_summary(
+        self, platform_id: str, pipelines: Optional[List[Pipeline]] = None
+    ) -> PipelineSummary:
+        """
+        Get pipeline status summary for a platform.
+
+        When reading from the CSV file, the shown status of every pipeline
+        is classified once per file version and summaries for all platforms
+        are cached together.
+
+        Args:
+            platform_id: Platform ID to summarize
+            pipelines: Already loaded pipelines (loaded from the source if None)
+
+        Returns:
+            PipelineSummary with counts by status
+        """
+        if pipelines is not None:
+            return super().get_pipeline_summary(platform_id, pipelines)
+
+        summaries = self._load_cached(
+            self.pipelines_file, self._summarize_pipelines, kind="pipeline_summaries"
+        )
+        return summaries.get(platform_id) or PipelineSummary()
+
+    def _summarize_pipelines(self) -> Dict[str, PipelineSummary]:
+        """Count the shown statuses of all pipelines per platform in one pass."""
+        counts: Dict[str, Counter[str]] = defaultdict(Counter)
+        for pipeline in self.load_pipelines():
+            counts[pipeline.platform.value][pipeline.shown_status] += 1
+
+        return {
+            platform_id: PipelineSummary(
+                successful=c["Succeeded"],
+                delayed=c["Delayed"],
+                failed=c["Failed"],
+                not_applicable=c["Not Applicable"],
+            )
+            for platform_id, c in counts.items()
+        }
+
     def load_bw_performance(self) -> List[dict]:
         """
         Load SAP B/W performance records.
@@ -197,35 +576,105 @@ class CSVDataProvider(DataProvider):
         Returns:
             List of performance record dictionaries
         """
-        rows = self._read_csv(self.bw_performance_file)
-        records = []
+        return self._load_cached(self.bw_performance_file, self._parse_bw_performance)
 
-        for row in rows:
-            try:
-                record = {
-                    "snapshot_ts": row.get("snapshot_ts", ""),
-                    "storage_usage_tb": float(row.get("storage_usage_tb", 0)),
-                    "storage_capacity_tb": float(row.get("storage_capacity_tb", 0)),
-                    "memory_usage_tb": float(row.get("memory_usage_tb", 0)),
-                    "memory_capacity_tb": float(row.get("memory_capacity_tb", 0)),
-                    "ymd": row.get("ymd", ""),
-                }
-                records.append(record)
-            except (ValueError, TypeError) as e:
-                logger.debug(f"Skipping invalid B/W performance row: {e}")
-                continue
-
-        if rows and not records:
+    def _parse_bw_performance(self) -> List[dict]:
+        """
+        Read and parse the B/W performance CSV file.
+
+        The numeric columns are converted as whole columns; rows where any
+        of them is not a number are skipped, as in _parse_bw_row.
+        """
+        df = self._read_csv_frame(self.bw_performance_file)
+        if df is None or df.empty:
+            return []
+
+        missing = [c for c in _BW_PERFORMANCE_COLUMNS if c not in df]
+        if missing:
+            logger.error(f"Missing columns {missing} in {self.bw_performance_file}")
+            return []
+
+        row_count = len(df)
+        df = df[list(_BW_PERFORMANCE_COLUMNS)]
+        numeric = df[list(_BW_NUMERIC_COLUMNS)]
+        try:
+            values = numeric.astype(np.float64)
+        except ValueError:
+            valid = numeric.map(_is_float).all(axis=1)
+            df = df[valid]
+            values = numeric[valid].astype(np.float64)
+
+        records: List[dict] = df.assign(**values).to_dict("records")
+
+        if not records:
             logger.warning(
-                f"No valid B/W records parsed from {len(rows)} rows in {self.bw_performance_file}"
+                f"No valid B/W records parsed from {row_count} rows in {self.bw_performance_file}"
             )
-        elif records:
+        else:
             logger.info(
                 f"Loaded {len(records)} B/W performance records from {self.bw_performance_file}"
             )
 
         return records
 
+    def get_bw_memory_stats(self, records: Optional[List[dict]] = None) -> HistoricalStats:
+        """
+        Get average and peak memory usage from B/W performance data.
+
+        Stats for the CSV file are computed once per file version and then
+        served from the cache.
+
+        Args:
+            records: Already loaded B/W performance records (loaded from the source if None)
+
+        Returns:
+            HistoricalStats with average and peak values in TB
+        """
+        if records is not None:
+            return super().get_bw_memory_stats(records)
+
+        return self._load_cached(
+            self.bw_performance_file,
+            lambda: super(CSVDataProvider, self).get_bw_memory_stats(self.load_bw_performance()),
+            kind="memory_stats",
+        )
+
+    def get_latest_bw_performance(self) -> Optional[dict]:
+        """
+        Get the most recent B/W performance record.
+
+        Only the last line of the CSV is read and parsed. If that line is
+        not a valid record, falls back to loading the full file.
+
+        Returns:
+            Latest performance record or None
+        """
+        columns, row = self._read_csv_last_row(self.bw_performance_file)
+        if row is None:
+            return None
+
+        if all(c in columns for c in _BW_PERFORMANCE_COLUMNS):
+            record = _parse_bw_row(row, [columns[c] for c in _BW_PERFORMANCE_COLUMNS])
+            if record is not None:
+                return record
+
+        return super().get_latest_bw_performance()
+
+    def get_data_version(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        Get the modification times and sizes of the CSV files.
+
+        Returns:
+            Tuple of (st_mtime_ns, st_size) per data file ((0, 0) for missing files)
+        """
+        versions = []
+        for filename in [self.tickets_file, self.pipelines_file, self.bw_performance_file]:
+            try:
+                versions.append(_file_signature(self._get_file_path(filename)))
+            except OSError:
+                versions.append((0, 0))
+        return tuple(versions)
+
     def is_available(self) -> bool:
         """
         Check if the CSV data directory exists and contains expected files.
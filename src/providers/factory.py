@@ -6,6 +6,7 @@ data provider based on configuration settings.
 """
 
 import logging
+from functools import lru_cache
 
 from config import settings, DataSourceType
 
@@ -14,9 +15,6 @@ from .csv_provider import CSVDataProvider
 
 logger = logging.getLogger(__name__)
 
-# Cached provider instance for reuse
-_provider_instance: DataProvider | None = None
-
 
 def get_data_provider(force_new: bool = False) -> DataProvider:
     """
@@ -43,15 +41,32 @@ def get_data_provider(force_new: bool = False) -> DataProvider:
         # Force a new provider instance
         provider = get_data_provider(force_new=True)
     """
-    global _provider_instance
+    if force_new:
+        reset_provider()
+    return _build_provider(settings.data_source.source_type)
+
+
+@lru_cache(maxsize=1)
+def _build_provider(source_type: DataSourceType) -> DataProvider:
+    """
+    Create the data provider for a data source type.
+
+    Cached, so every call with the configured source type returns the same
+    instance until reset_provider() is called.
 
-    if _provider_instance is not None and not force_new:
-        return _provider_instance
+    Args:
+        source_type: Configured data source type
+
+    Returns:
+        A new DataProvider instance
 
-    source_type = settings.data_source.source_type
+    Raises:
+        ValueError: If the data source type is not supported
+    """
+    provider: DataProvider
 
     if source_type == DataSourceType.CSV:
-        _provider_instance = CSVDataProvider()
+        provider = CSVDataProvider()
         logger.info("Created CSV data provider")
 
     elif source_type == DataSourceType.AZURE_BLOB:
@@ -59,20 +74,20 @@ def get_data_provider(force_new: bool = False) -> DataProvider:
         # mounted blob container. The blob is mounted via FUSE or similar.
         # For direct blob access, implement AzureBlobProvider in the future.
         logger.info("Azure Blob configured - using CSV provider with mounted storage")
-        _provider_instance = CSVDataProvider()
+        provider = CSVDataProvider()
 
     elif source_type == DataSourceType.DATABRICKS:
         # Future: Implement DatabricksProvider for direct connection
         logger.warning("Databricks provider not yet implemented, falling back to CSV")
-        _provider_instance = CSVDataProvider()
+        provider = CSVDataProvider()
 
     else:
         raise ValueError(f"Unsupported data source type: {source_type}")
 
     # Log provider info
-    logger.info(f"Data provider initialized:\n{_provider_instance.get_source_info()}")
+    logger.info(f"Data provider initialized:\n{provider.get_source_info()}")
 
-    return _provider_instance
+    return provider
 
 
 def reset_provider() -> None:
@@ -82,6 +97,5 @@ def reset_provider() -> None:
     Use this to force re-initialization of the provider, for example
     after configuration changes or for testing.
     """
-    global _provider_instance
-    _provider_instance = None
+    _build_provider.cache_clear()
     logger.debug("Data provider cache reset")
@@ -2,6 +2,24 @@
 Utility functions for Platform Health Dashboard.
 """
 
+import functools
+import threading
+import time
+from dataclasses import is_dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, ParamSpec, Tuple, TypeVar
+
+import orjson
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# ServiceNow form pages by ticket number prefix
+_SN_PATHS = {
+    "INC": "incident.do",
+    "RITM": "sc_req_item.do",
+    "PRB": "problem.do",
+}
+
 
 def generate_servicenow_link(ticket_number: str, instance: str = "aldiprod") -> str:
     """
@@ -16,12 +34,153 @@ def generate_servicenow_link(ticket_number: str, instance: str = "aldiprod") ->
     """
     base_url = f"https://{instance}.service-now.com"
 
-    if ticket_number.startswith("INC"):
-        return f"{base_url}/incident.do?sysparm_query=number={ticket_number}"
-    elif ticket_number.startswith("RITM"):
-        return f"{base_url}/sc_req_item.do?sysparm_query=number={ticket_number}"
-    elif ticket_number.startswith("PRB"):
-        return f"{base_url}/problem.do?sysparm_query=number={ticket_number}"
-    else:
-        search_uri = "%2F$sn_global_search_results.do%3Fsysparm_search%3D"
-        return f"{base_url}/nav_to.do?uri={search_uri}{ticket_number}"
+    path = _SN_PATHS.get(ticket_number[:3]) or _SN_PATHS.get(ticket_number[:4])
+    if path is not None:
+        return f"{base_url}/{path}?sysparm_query=number={ticket_number}"
+
+    search_uri = "%2F$sn_global_search_results.do%3Fsysparm_search%3D"
+    return f"{base_url}/nav_to.do?uri={search_uri}{ticket_number}"
+
+
+def _encode_model(obj: Any) -> Any:
+    """
+    Encode a dataclass model for orjson, which calls this for each one.
+
+    Models are encoded as their to_dict(), which can differ from their
+    fields (MetricWithOutliers keeps its outliers as parallel arrays,
+    PipelineSummary adds a computed total). Dataclasses without to_dict()
+    are encoded field by field.
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    if is_dataclass(obj):
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def serialize(payload: Any) -> bytes:
+    """
+    Serialize a dashboard payload to JSON bytes.
+
+    NumPy arrays and scalars are encoded directly, so vectorized results do
+    not need a ``.tolist()`` round trip before being sent to the client.
+    Dataclass models can be passed as they are and encode to the same JSON
+    as their ``to_dict()``.
+
+    Dash serializes callback outputs itself, so this is for code that
+    returns raw JSON, such as an export endpoint on the Flask server.
+
+    Args:
+        payload: JSON-compatible data, dataclass models or NumPy values
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(
+        payload,
+        default=_encode_model,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS,
+    )
+
+
+class TTLCache(Generic[P, R]):
+    """
+    Time-limited memoization of a function's results.
+
+    Results are keyed by the call arguments plus an optional data version
+    (e.g. source file modification times), so a changed input file is
+    picked up immediately instead of after the TTL expires. Concurrent
+    calls that miss on the same key are coalesced: one thread computes the
+    value while the others wait for it.
+
+    Cached values are shared between callers and must be treated as
+    read-only.
+
+    Attributes:
+        ttl_seconds: How long a cached result is reused (0 disables caching)
+    """
+
+    def __init__(
+        self,
+        func: Callable[P, R],
+        ttl_seconds: float,
+        version: Optional[Callable[[], Hashable]] = None,
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._version = version
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, R]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        if self.ttl_seconds <= 0:
+            return self._func(*args, **kwargs)
+
+        version = self._version() if self._version is not None else None
+        key = (args, tuple(sorted(kwargs.items())), version)
+
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have filled the entry while we waited
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                return entry[1]
+
+            value = self._func(*args, **kwargs)
+            now = time.monotonic()
+
+            with self._lock:
+                self._prune(now)
+                self._entries[key] = (now, value)
+
+        return value
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries (caller must hold the lock)."""
+        expired = [k for k, (ts, _) in self._entries.items() if now - ts >= self.ttl_seconds]
+        for k in expired:
+            del self._entries[k]
+            self._key_locks.pop(k, None)
+
+    def invalidate(self) -> None:
+        """Discard all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+
+def ttl_cache(
+    ttl_seconds: float, version: Optional[Callable[[], Hashable]] = None
+) -> Callable[[Callable[P, R]], TTLCache[P, R]]:
+    """
+    Decorator caching a function's results for a limited time.
+
+    Args:
+        ttl_seconds: How long a cached result is reused (0 disables caching)
+        version: Optional callable whose return value is part of the cache
+            key; a change in its value invalidates previous results
+
+    Returns:
+        Decorator wrapping the function in a TTLCache
+
+    Example:
+        @ttl_cache(30, version=lambda: os.stat("tickets.csv").st_mtime_ns)
+        def get_ticket_summary() -> Dict[str, int]:
+            ...
+
+        get_ticket_summary.invalidate()
+    """
+
+    def decorator(func: Callable[P, R]) -> TTLCache[P, R]:
+        return TTLCache(func, ttl_seconds, version)
+
+    return decorator
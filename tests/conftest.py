@@ -0,0 +1,61 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports, once for every test module
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from data import get_platforms, get_summary_counts, get_tickets
+
+# Test modules that import Dash, which are run after the others
+_DASH_TEST_MODULES = frozenset(["test_components.py"])
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Run the Dash component tests after all other tests.
+
+    The sort is stable, so the order within each group is kept as
+    collected, including any shuffling done by plugins such as
+    pytest-randomly. With -x, the fast data and provider tests fail
+    first instead of waiting for the Dash import.
+    """
+    items.sort(key=lambda item: item.path.name in _DASH_TEST_MODULES)
+
+
+@pytest.fixture(scope="session")
+def platforms():
+    """Platform data from get_platforms(), loaded once per session."""
+    return get_platforms()
+
+
+@pytest.fixture(scope="session")
+def tickets():
+    """Ticket data from get_tickets(), loaded once per session."""
+    return get_tickets()
+
+
+@pytest.fixture(scope="session")
+def counts():
+    """Summary counts from get_summary_counts(), loaded once per session."""
+    return get_summary_counts()
+
+
+@pytest.fixture(scope="session")
+def components_mod():
+    """
+    The components module, imported on first use.
+
+    Importing it pulls in Dash, dash-bootstrap-components and Plotly, so it
+    is deferred until a test that needs it runs instead of happening while
+    tests are collected. Its html and dbc attributes are the Dash modules
+    the components are built from.
+    """
+    import components
+
+    return components
@@ -2,105 +2,89 @@
 Tests for the components module.
 """
 
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
-from components import (
-    create_status_indicator,
-    create_platform_card,
-    create_summary_bar,
-    create_ticket_table,
-    STATUS_COLORS,
-    PRIORITY_COLORS,
-)
+import pytest
+
+STATUSES = frozenset(["healthy", "attention", "critical"])
+STATUS_COLOR_KEYS = frozenset(["bg", "light", "text"])
+PRIORITIES = frozenset(["High", "Medium", "Low"])
+
+
+@pytest.fixture(scope="module")
+def platform_dict():
+    """A healthy platform in the get_platforms() dictionary format."""
+    return {
+        "id": "test",
+        "name": "Test Platform",
+        "subtitle": "Test",
+        "status": "healthy",
+        "status_label": "Healthy",
+        "metrics": {
+            "primary": {"label": "Test", "value": "1"},
+            "secondary": {"label": "Test", "value": "2"},
+            "tertiary": {"label": "Test", "value": "3"},
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def cards(components_mod, platform_dict):
+    """The test platform rendered as a card, unselected and selected."""
+    return (
+        components_mod.create_platform_card(platform_dict, is_selected=False),
+        components_mod.create_platform_card(platform_dict, is_selected=True),
+    )
 
 
 class TestStatusColors:
     """Tests for STATUS_COLORS configuration."""
 
-    def test_has_all_statuses(self):
+    def test_has_all_statuses(self, components_mod):
         """Should have colors for all status types."""
-        assert "healthy" in STATUS_COLORS
-        assert "attention" in STATUS_COLORS
-        assert "critical" in STATUS_COLORS
+        missing = STATUSES - components_mod.STATUS_COLORS.keys()
+        assert not missing, f"No colors for statuses: {missing}"
 
-    def test_color_structure(self):
+    def test_color_structure(self, components_mod):
         """Each status should have bg, light, and text colors."""
-        for status, colors in STATUS_COLORS.items():
-            assert "bg" in colors
-            assert "light" in colors
-            assert "text" in colors
+        for status, colors in components_mod.STATUS_COLORS.items():
+            missing = STATUS_COLOR_KEYS - colors.keys()
+            assert not missing, f"Status {status} missing colors: {missing}"
 
 
 class TestPriorityColors:
     """Tests for PRIORITY_COLORS configuration."""
 
-    def test_has_all_priorities(self):
+    def test_has_all_priorities(self, components_mod):
         """Should have colors for all priority levels."""
-        assert "High" in PRIORITY_COLORS
-        assert "Medium" in PRIORITY_COLORS
-        assert "Low" in PRIORITY_COLORS
+        missing = PRIORITIES - components_mod.PRIORITY_COLORS.keys()
+        assert not missing, f"No colors for priorities: {missing}"
 
 
 class TestCreateStatusIndicator:
     """Tests for create_status_indicator function."""
 
-    def test_returns_div(self):
+    def test_returns_div(self, components_mod):
         """Should return a Dash html.Div component."""
-        from dash import html
+        indicator = components_mod.create_status_indicator("healthy")
+        assert isinstance(indicator, components_mod.html.Div)
 
-        indicator = create_status_indicator("healthy")
-        assert isinstance(indicator, html.Div)
-
-    def test_has_correct_class(self):
+    def test_has_correct_class(self, components_mod):
         """Should have status-indicator class."""
-        indicator = create_status_indicator("healthy")
+        indicator = components_mod.create_status_indicator("healthy")
         assert indicator.className == "status-indicator"
 
 
 class TestCreatePlatformCard:
     """Tests for create_platform_card function."""
 
-    def test_returns_card(self):
-        """Should return a Dash dbc.Card component."""
-        import dash_bootstrap_components as dbc
-
-        platform = {
-            "id": "test",
-            "name": "Test Platform",
-            "subtitle": "Test",
-            "status": "healthy",
-            "status_label": "Healthy",
-            "metrics": {
-                "primary": {"label": "Test", "value": "1"},
-                "secondary": {"label": "Test", "value": "2"},
-                "tertiary": {"label": "Test", "value": "3"},
-            },
-        }
-
-        card = create_platform_card(platform)
-        assert isinstance(card, dbc.Card)
-
-    def test_selected_state(self):
+    def test_returns_card(self, components_mod, cards):
+        """Should return a Dash dbc.Card component in both states."""
+        card_not_selected, card_selected = cards
+        assert isinstance(card_not_selected, components_mod.dbc.Card)
+        assert isinstance(card_selected, components_mod.dbc.Card)
+
+    def test_selected_state(self, cards):
         """Should apply different styling when selected."""
-        platform = {
-            "id": "test",
-            "name": "Test",
-            "subtitle": "Test",
-            "status": "healthy",
-            "status_label": "Healthy",
-            "metrics": {
-                "primary": {"label": "Test", "value": "1"},
-                "secondary": {"label": "Test", "value": "2"},
-                "tertiary": {"label": "Test", "value": "3"},
-            },
-        }
-
-        card_not_selected = create_platform_card(platform, is_selected=False)
-        card_selected = create_platform_card(platform, is_selected=True)
+        card_not_selected, card_selected = cards
 
         # Style should be different
         assert card_not_selected.style != card_selected.style
@@ -109,31 +93,25 @@ class TestCreatePlatformCard:
 class TestCreateSummaryBar:
     """Tests for create_summary_bar function."""
 
-    def test_returns_div(self):
+    def test_returns_div(self, components_mod):
         """Should return a Dash html.Div component."""
-        from dash import html
-
         counts = {"healthy": 2, "attention": 1, "critical": 1, "total_tickets": 100}
 
-        bar = create_summary_bar(counts)
-        assert isinstance(bar, html.Div)
+        bar = components_mod.create_summary_bar(counts)
+        assert isinstance(bar, components_mod.html.Div)
 
 
 class TestCreateTicketTable:
     """Tests for create_ticket_table function."""
 
-    def test_empty_tickets(self):
+    def test_empty_tickets(self, components_mod):
         """Should show 'No tickets found' when empty."""
-        from dash import html
-
-        table = create_ticket_table([])
-        assert isinstance(table, html.Div)
-        assert "No tickets found" in str(table)
+        table = components_mod.create_ticket_table([])
+        assert isinstance(table, components_mod.html.Div)
+        assert table.children == "No tickets found"
 
-    def test_with_tickets(self):
+    def test_with_tickets(self, components_mod):
         """Should return a table when tickets provided."""
-        import dash_bootstrap_components as dbc
-
         tickets = [
             {
                 "id": "INC001",
@@ -145,5 +123,5 @@ class TestCreateTicketTable:
             }
         ]
 
-        table = create_ticket_table(tickets)
-        assert isinstance(table, dbc.Table)
+        table = components_mod.create_ticket_table(tickets)
+        assert isinstance(table, components_mod.dbc.Table)
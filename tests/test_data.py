@@ -2,96 +2,114 @@
 Tests for the data module.
 """
 
-import sys
-import os
+from collections import Counter, defaultdict
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+import pytest
 
-from data import get_platforms, get_tickets, get_summary_counts
+from data import detect_outliers
+from models import PlatformId
+
+REQUIRED_PLATFORM_FIELDS = frozenset(
+    ["id", "name", "subtitle", "status", "status_label", "metrics"]
+)
+REQUIRED_METRIC_SLOTS = frozenset(["primary", "secondary", "tertiary"])
+REQUIRED_METRIC_FIELDS = frozenset(["label", "value"])
+REQUIRED_TICKET_FIELDS = frozenset(["id", "platform", "title", "priority", "age", "owner"])
+REQUIRED_COUNT_KEYS = frozenset(["healthy", "attention", "critical", "total_tickets"])
+VALID_STATUSES = frozenset(["healthy", "attention", "critical"])
+VALID_PRIORITIES = frozenset(["High", "Medium", "Low"])
+PLATFORM_IDS = [platform_id.value for platform_id in PlatformId]
+
+
+@pytest.fixture(scope="session")
+def platforms_by_id(platforms):
+    """Platforms keyed by platform id."""
+    return {p["id"]: p for p in platforms}
+
+
+@pytest.fixture(scope="session")
+def tickets_by_platform(tickets):
+    """Tickets grouped by platform id."""
+    grouped = defaultdict(list)
+    for ticket in tickets:
+        grouped[ticket["platform"]].append(ticket)
+    return grouped
+
+
+@pytest.fixture(scope="session")
+def status_counts(platforms):
+    """Number of platforms per status."""
+    return Counter(p["status"] for p in platforms)
+
+
+@pytest.fixture(params=PLATFORM_IDS)
+def platform(request, platforms_by_id):
+    """One platform per test, parametrized over all platform ids."""
+    if request.param not in platforms_by_id:
+        pytest.fail(f"No platform returned for {request.param}")
+    return platforms_by_id[request.param]
+
+
+@pytest.fixture(params=PLATFORM_IDS)
+def platform_tickets(request, tickets_by_platform):
+    """The tickets of one platform per test, parametrized over all platform ids."""
+    return tickets_by_platform[request.param]
 
 
 class TestGetPlatforms:
     """Tests for get_platforms function."""
 
-    def test_returns_list(self):
+    def test_returns_list(self, platforms):
         """Should return a list of platforms."""
-        platforms = get_platforms()
         assert isinstance(platforms, list)
 
-    def test_has_four_platforms(self):
+    def test_has_four_platforms(self, platforms):
         """Should return exactly 4 platforms."""
-        platforms = get_platforms()
         assert len(platforms) == 4
 
-    def test_platform_has_required_fields(self):
+    def test_platform_has_required_fields(self, platform):
         """Each platform should have required fields."""
-        platforms = get_platforms()
-        required_fields = ["id", "name", "subtitle", "status", "status_label", "metrics"]
+        missing = REQUIRED_PLATFORM_FIELDS - platform.keys()
+        assert not missing, f"Platform missing fields: {missing}"
 
-        for platform in platforms:
-            for field in required_fields:
-                assert field in platform, f"Platform missing field: {field}"
-
-    def test_platform_status_valid(self):
+    def test_platform_status_valid(self, platform):
         """Platform status should be one of healthy, attention, critical."""
-        platforms = get_platforms()
-        valid_statuses = ["healthy", "attention", "critical"]
-
-        for platform in platforms:
-            assert platform["status"] in valid_statuses
+        assert platform["status"] in VALID_STATUSES
 
-    def test_metrics_structure(self):
+    def test_metrics_structure(self, platform):
         """Platform metrics should have primary, secondary, tertiary."""
-        platforms = get_platforms()
-
-        for platform in platforms:
-            metrics = platform["metrics"]
-            assert "primary" in metrics
-            assert "secondary" in metrics
-            assert "tertiary" in metrics
+        metrics = platform["metrics"]
+        assert REQUIRED_METRIC_SLOTS <= metrics.keys()
 
-            # Each metric should have label and value
-            for key in ["primary", "secondary", "tertiary"]:
-                assert "label" in metrics[key]
-                assert "value" in metrics[key]
+        # Each metric should have label and value
+        for key in REQUIRED_METRIC_SLOTS:
+            assert REQUIRED_METRIC_FIELDS <= metrics[key].keys()
 
 
 class TestGetTickets:
     """Tests for get_tickets function."""
 
-    def test_returns_list(self):
+    def test_returns_list(self, tickets):
         """Should return a list of tickets."""
-        tickets = get_tickets()
         assert isinstance(tickets, list)
 
-    def test_tickets_not_empty(self):
+    def test_tickets_not_empty(self, tickets):
         """Should return at least one ticket."""
-        tickets = get_tickets()
         assert len(tickets) > 0
 
-    def test_ticket_has_required_fields(self):
+    def test_ticket_has_required_fields(self, platform_tickets):
         """Each ticket should have required fields."""
-        tickets = get_tickets()
-        required_fields = ["id", "platform", "title", "priority", "age", "owner"]
+        for ticket in platform_tickets:
+            missing = REQUIRED_TICKET_FIELDS - ticket.keys()
+            assert not missing, f"Ticket {ticket.get('id')} missing fields: {missing}"
 
-        for ticket in tickets:
-            for field in required_fields:
-                assert field in ticket, f"Ticket missing field: {field}"
-
-    def test_ticket_priority_valid(self):
+    def test_ticket_priority_valid(self, platform_tickets):
         """Ticket priority should be High, Medium, or Low."""
-        tickets = get_tickets()
-        valid_priorities = ["High", "Medium", "Low"]
-
-        for ticket in tickets:
-            assert ticket["priority"] in valid_priorities
+        assert {t["priority"] for t in platform_tickets} <= VALID_PRIORITIES
 
-    def test_ticket_platform_exists(self):
+    def test_ticket_platform_exists(self, platforms, tickets):
         """Ticket platform should match a valid platform id."""
-        tickets = get_tickets()
-        platforms = get_platforms()
-        valid_platform_ids = [p["id"] for p in platforms]
+        valid_platform_ids = frozenset(p["id"] for p in platforms)
 
         for ticket in tickets:
             assert ticket["platform"] in valid_platform_ids
@@ -100,37 +118,49 @@ class TestGetTickets:
 class TestGetSummaryCounts:
     """Tests for get_summary_counts function."""
 
-    def test_returns_dict(self):
+    def test_returns_dict(self, counts):
         """Should return a dictionary."""
-        counts = get_summary_counts()
         assert isinstance(counts, dict)
 
-    def test_has_required_keys(self):
+    def test_has_required_keys(self, counts):
         """Should have healthy, attention, critical, total_tickets keys."""
-        counts = get_summary_counts()
-        required_keys = ["healthy", "attention", "critical", "total_tickets"]
+        missing = REQUIRED_COUNT_KEYS - counts.keys()
+        assert not missing, f"Counts missing keys: {missing}"
 
-        for key in required_keys:
-            assert key in counts
-
-    def test_counts_are_integers(self):
+    def test_counts_are_integers(self, counts):
         """All counts should be integers."""
-        counts = get_summary_counts()
-
         for key, value in counts.items():
             assert isinstance(value, int)
 
-    def test_counts_match_data(self):
-        """Counts should match actual platform data."""
-        counts = get_summary_counts()
-        platforms = get_platforms()
-        tickets = get_tickets()
-
-        healthy_count = sum(1 for p in platforms if p["status"] == "healthy")
-        attention_count = sum(1 for p in platforms if p["status"] == "attention")
-        critical_count = sum(1 for p in platforms if p["status"] == "critical")
+    @pytest.mark.parametrize("status", sorted(VALID_STATUSES))
+    def test_status_count_matches_data(self, status, status_counts, counts):
+        """Each status count should match the number of platforms in that status."""
+        assert counts[status] == status_counts[status]
 
-        assert counts["healthy"] == healthy_count
-        assert counts["attention"] == attention_count
-        assert counts["critical"] == critical_count
+    def test_total_tickets_matches_data(self, tickets, counts):
+        """The ticket total should match the number of tickets."""
         assert counts["total_tickets"] == len(tickets)
+
+
+class TestDetectOutliers:
+    """Tests for detect_outliers function."""
+
+    def test_flags_warning_and_critical(self):
+        """Values at or above each level should be flagged with that severity."""
+        outliers = detect_outliers([1, 5, 3, 10, 7], {"warning": 5, "critical": 10})
+
+        assert outliers == [
+            {"index": 1, "value": 5, "severity": "warning"},
+            {"index": 3, "value": 10, "severity": "critical"},
+            {"index": 4, "value": 7, "severity": "warning"},
+        ]
+
+    def test_missing_levels_never_trigger(self):
+        """A threshold without a level should not flag anything for that level."""
+        outliers = detect_outliers([1.5, 99.0], {"critical": 50})
+
+        assert outliers == [{"index": 1, "value": 99.0, "severity": "critical"}]
+
+    def test_empty_values(self):
+        """Should return an empty list for an empty series."""
+        assert detect_outliers([], {"warning": 1, "critical": 2}) == []
@@ -0,0 +1,146 @@
+"""
+Tests for the models package.
+"""
+
+import numpy as np
+import pytest
+
+from models import (
+    MetricWithOutliers,
+    Outlier,
+    OutlierSeverity,
+    Pipeline,
+    PipelineStatus,
+    PlatformId,
+)
+from models.pipeline import _classify_status
+
+
+def _classify_status_reference(status, original_status):
+    """The substring rules _classify_status replaced, kept as a reference."""
+    status_lower = status.lower()
+    original_lower = original_status.lower()
+
+    if "failed" in status_lower or original_lower == "r" or "failed" in original_lower:
+        return PipelineStatus.FAILED
+    elif "delayed" in status_lower:
+        return PipelineStatus.DELAYED
+    elif "not applicable" in status_lower:
+        return PipelineStatus.NOT_APPLICABLE
+    elif "running" in status_lower:
+        return PipelineStatus.RUNNING
+    elif "pending" in status_lower or "scheduled" in status_lower:
+        return PipelineStatus.PENDING
+    elif (
+        "within expected" in status_lower
+        or original_lower == "g"
+        or "succeeded" in original_lower
+    ):
+        return PipelineStatus.SUCCESSFUL
+    else:
+        return PipelineStatus.SUCCESSFUL
+
+
+# Status pairs from the pipelines export, plus edge cases around the rules
+STATUS_PAIRS = [
+    ("Delayed - Finished", "Succeeded"),
+    ("Delayed - To Be Finished", "G"),
+    ("Delayed - To Be Finished", "Succeeded"),
+    ("Failed", "R"),
+    ("Not Applicable", "Succeeded"),
+    ("Within Expected", "Failed"),
+    ("Within Expected", "G"),
+    ("Within Expected", "Succeeded"),
+    ("Running", ""),
+    ("Scheduled", "G"),
+    ("Pending", "Succeeded"),
+    ("", ""),
+    ("Within Expected", "R"),
+    ("Within Expected", "r\n"),
+    ("Within Expected", "RR"),
+    ("Delayed", "Delayed"),
+    ("Not Applicable", "Running"),
+]
+
+
+class TestMetricWithOutliers:
+    """Tests for MetricWithOutliers."""
+
+    def test_from_outliers_stores_parallel_arrays(self):
+        """Outlier objects should be split into index, value and severity arrays."""
+        metric = MetricWithOutliers.from_outliers(
+            [1.0, 5.0, 10.0],
+            [
+                Outlier(1, 5.0, OutlierSeverity.WARNING),
+                Outlier(2, 10.0, OutlierSeverity.CRITICAL),
+            ],
+        )
+
+        assert metric.values.dtype == np.float32
+        assert metric.outlier_indices.tolist() == [1, 2]
+        assert metric.outlier_values.tolist() == [5.0, 10.0]
+        assert metric.outlier_severities.tolist() == [0, 1]
+
+    def test_outliers_round_trip(self):
+        """The outliers property should rebuild the Outlier objects."""
+        outliers = [
+            Outlier(0, 7.5, OutlierSeverity.WARNING),
+            Outlier(3, 12.0, OutlierSeverity.CRITICAL),
+        ]
+        metric = MetricWithOutliers.from_outliers([7.5, 1.0, 2.0, 12.0], outliers)
+
+        assert metric.outliers == outliers
+
+    def test_to_dict(self):
+        """to_dict() should list values and one dictionary per outlier."""
+        metric = MetricWithOutliers.from_outliers(
+            [1.5, 9.0], [Outlier(1, 9.0, OutlierSeverity.CRITICAL)]
+        )
+
+        assert metric.to_dict() == {
+            "values": [1.5, 9.0],
+            "outliers": [{"index": 1, "value": 9.0, "severity": "critical"}],
+        }
+
+    def test_to_dict_values_keep_one_decimal(self):
+        """float32 storage should not leak widening artifacts into to_dict()."""
+        metric = MetricWithOutliers(values=[45.3, 99.9, 23.4, 0.1, 1234.5])
+
+        assert metric.to_dict()["values"] == [45.3, 99.9, 23.4, 0.1, 1234.5]
+
+    def test_empty(self):
+        """A default metric should have no values and no outliers."""
+        metric = MetricWithOutliers()
+
+        assert metric.outliers == []
+        assert metric.to_dict() == {"values": [], "outliers": []}
+
+
+class TestClassifyStatus:
+    """Tests for pipeline status classification."""
+
+    @pytest.mark.parametrize("status, original_status", STATUS_PAIRS)
+    def test_matches_reference_rules(self, status, original_status):
+        """The compiled rules should classify like the substring rules."""
+        assert _classify_status(status, original_status) == _classify_status_reference(
+            status, original_status
+        )
+
+
+class TestPipelineFromCsvRow:
+    """Tests for Pipeline.from_csv_row."""
+
+    def test_row_without_pipeline_id_is_kept(self):
+        """Rows with an empty pipeline id should still be parsed and counted."""
+        pipeline = Pipeline.from_csv_row(
+            {
+                "pipeline_id": "",
+                "platform_id": "SAP_BW",
+                "pipeline_transformed_status": "Failed",
+                "pipeline_original_status": "R",
+            }
+        )
+
+        assert pipeline.pipeline_id == ""
+        assert pipeline.platform == PlatformId.SAPBW
+        assert pipeline.status == PipelineStatus.FAILED
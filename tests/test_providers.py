@@ -0,0 +1,120 @@
+"""
+Tests for the providers module.
+"""
+
+import csv
+import os
+
+from models import Pipeline
+from providers import CSVDataProvider, clear_csv_cache
+
+BW_HEADER = (
+    "platform_id,snapshot_ts,storage_usage_tb,storage_capacity_tb,"
+    "memory_usage_tb,memory_capacity_tb,ymd\n"
+)
+
+
+def _bw_row(ts, memory):
+    return f"SAP_BW,{ts},67.0,78.5,{memory},32.0,20251211\n"
+
+
+def _write_bw_csv(path, rows):
+    path.write_text(BW_HEADER + "".join(rows), encoding="utf-8")
+
+
+PIPELINES_CSV = (
+    "platform_id,pipeline_id,snapshot_ts,pipeline_end_ts,pipeline_expected_end_ts,"
+    "pipeline_delay_time_qty,pipeline_original_status,pipeline_transformed_status\n"
+    "EDLAP,P-1,2026-01-07T12:00:00Z,,,3.0,Succeeded,Within Expected\n"
+    "EDLAP,,2026-01-07T12:00:00Z,,,null,Failed,Within Expected\n"
+    "SAP_BW,P-2,2026-01-07T12:00:00Z,,,,R,Failed\n"
+    "Unknown,P-3,2026-01-07T12:00:00Z,,,abc,G,Delayed - Finished\n"
+)
+
+
+class TestCSVDataProvider:
+    """Tests for CSVDataProvider."""
+
+    def test_latest_bw_performance_matches_last_record(self, tmp_path):
+        """The tail read should return the same record as a full load."""
+        rows = [_bw_row(f"2025-12-11T{h:02d}:00:00Z", 20 + h / 10) for h in range(24)]
+        _write_bw_csv(tmp_path / "bw.csv", rows + ["\n"])
+        provider = CSVDataProvider(data_directory=tmp_path, bw_performance_file="bw.csv")
+
+        latest = provider.get_latest_bw_performance()
+
+        assert latest == provider.load_bw_performance()[-1]
+        assert latest["snapshot_ts"] == "2025-12-11T23:00:00Z"
+
+    def test_latest_bw_performance_empty_file(self, tmp_path):
+        """A file with only a header should have no latest record."""
+        _write_bw_csv(tmp_path / "bw.csv", [])
+        provider = CSVDataProvider(data_directory=tmp_path, bw_performance_file="bw.csv")
+
+        assert provider.get_latest_bw_performance() is None
+
+    def test_load_reuses_parsed_records_until_file_changes(self, tmp_path):
+        """Unchanged files should be served from the cache."""
+        clear_csv_cache()
+        path = tmp_path / "bw.csv"
+        _write_bw_csv(path, [_bw_row("2025-12-11T10:00:00Z", 20.0)])
+        provider = CSVDataProvider(data_directory=tmp_path, bw_performance_file="bw.csv")
+
+        first = provider.load_bw_performance()
+        assert provider.load_bw_performance() is first
+
+        _write_bw_csv(path, [_bw_row("2025-12-11T11:00:00Z", 21.0)] * 2)
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+        assert len(provider.load_bw_performance()) == 2
+
+    def test_load_detects_rewrite_with_same_mtime(self, tmp_path):
+        """A changed size should invalidate the cache even if the mtime is unchanged."""
+        clear_csv_cache()
+        path = tmp_path / "bw.csv"
+        _write_bw_csv(path, [_bw_row("2025-12-11T10:00:00Z", 20.0)])
+        mtime = os.stat(path).st_mtime_ns
+        provider = CSVDataProvider(data_directory=tmp_path, bw_performance_file="bw.csv")
+
+        assert len(provider.load_bw_performance()) == 1
+
+        _write_bw_csv(path, [_bw_row("2025-12-11T11:00:00Z", 21.0)] * 2)
+        os.utime(path, ns=(0, mtime))
+        assert len(provider.load_bw_performance()) == 2
+
+    def test_load_all_matches_individual_loads(self):
+        """Concurrent loading should return the same data as separate loads."""
+        provider = CSVDataProvider()
+
+        tickets, pipelines, latest_bw = provider.load_all()
+
+        assert tickets == provider.load_tickets()
+        assert pipelines == provider.load_pipelines()
+        assert latest_bw == provider.load_bw_performance()[-1]
+
+    def test_load_all_reads_only_latest_bw_row(self, tmp_path, monkeypatch):
+        """The latest B/W record should come from the tail read, not a full load."""
+        _write_bw_csv(tmp_path / "bw.csv", [_bw_row("2025-12-11T10:00:00Z", 20.0)])
+        provider = CSVDataProvider(data_directory=tmp_path, bw_performance_file="bw.csv")
+
+        def fail():
+            raise AssertionError("full B/W load")
+
+        monkeypatch.setattr(provider, "load_bw_performance", fail)
+        _, _, latest_bw = provider.load_all()
+
+        assert latest_bw["snapshot_ts"] == "2025-12-11T10:00:00Z"
+
+    def test_load_pipelines_matches_row_parser(self, tmp_path):
+        """The pandas path should keep and parse the same rows as from_csv_row."""
+        clear_csv_cache()
+        path = tmp_path / "pipelines.csv"
+        path.write_text(PIPELINES_CSV, encoding="utf-8")
+        provider = CSVDataProvider(data_directory=tmp_path, pipelines_file="pipelines.csv")
+
+        with open(path, newline="", encoding="utf-8") as f:
+            expected = [Pipeline.from_csv_row(row) for row in csv.DictReader(f)]
+
+        pipelines = provider.load_pipelines()
+
+        assert pipelines == expected
+        assert [p.pipeline_id for p in pipelines] == ["P-1", "", "P-2", "P-3"]
@@ -0,0 +1,119 @@
+"""
+Tests for the utils module.
+"""
+
+import json
+import threading
+import time
+
+import numpy as np
+
+from models import (
+    MachineData,
+    MetricWithOutliers,
+    MultiMachinePerformanceData,
+    Outlier,
+    OutlierSeverity,
+)
+from models.performance import AggregatedMetrics, MachineOutliers
+from utils import serialize, ttl_cache
+
+
+class TestSerialize:
+    """Tests for serialize function."""
+
+    def test_serializes_numpy_values(self):
+        """NumPy arrays should be encoded without converting to lists first."""
+        payload = {"values": np.array([1.5, 2.0]), "count": np.int64(3)}
+        assert json.loads(serialize(payload)) == {"values": [1.5, 2.0], "count": 3}
+
+    def test_serializes_models_like_to_dict(self):
+        """Dataclass models should encode to the same JSON as their to_dict()."""
+        data = MultiMachinePerformanceData(
+            timestamps=["2025-01-01 00:00"],
+            machines={"tab-01": MachineData(users=[12.0], cpu_percent=[40.5])},
+            machine_outliers={
+                "tab-01": MachineOutliers(cpu=[Outlier(0, 40.5, OutlierSeverity.WARNING)])
+            },
+            aggregated=AggregatedMetrics(
+                cpu_percent=MetricWithOutliers.from_outliers(
+                    [40.5, 95.0], [Outlier(1, 95.0, OutlierSeverity.CRITICAL)]
+                )
+            ),
+        )
+        assert json.loads(serialize(data)) == data.to_dict()
+
+
+class TestTTLCache:
+    """Tests for ttl_cache decorator."""
+
+    def test_reuses_result_within_ttl(self):
+        """Repeated calls with the same arguments should compute once."""
+        calls = []
+
+        @ttl_cache(60)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert square(4) == 16
+        assert calls == [3, 4]
+
+    def test_invalidate(self):
+        """invalidate() should force recomputation."""
+        calls = []
+
+        @ttl_cache(60)
+        def value():
+            calls.append(1)
+            return len(calls)
+
+        assert value() == 1
+        value.invalidate()
+        assert value() == 2
+
+    def test_version_change_recomputes(self):
+        """A changed data version should bypass the cached result."""
+        version = [1]
+
+        @ttl_cache(60, version=lambda: version[0])
+        def current():
+            return version[0]
+
+        assert current() == 1
+        version[0] = 2
+        assert current() == 2
+
+    def test_zero_ttl_disables_caching(self):
+        """A TTL of zero should call through every time."""
+        calls = []
+
+        @ttl_cache(0)
+        def value():
+            calls.append(1)
+            return len(calls)
+
+        assert value() == 1
+        assert value() == 2
+
+    def test_concurrent_misses_coalesce(self):
+        """Concurrent callers missing on the same key should share one computation."""
+        calls = []
+
+        @ttl_cache(60)
+        def slow():
+            calls.append(1)
+            time.sleep(0.05)
+            return "done"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(slow())) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["done"] * 5
+        assert len(calls) == 1